@@ -173,6 +173,19 @@ def open_browser_delayed(url: str, delay: int = 2):
     thread.daemon = True
     thread.start()
 
+# Both apps use st.fragment and lazily generated downloads
+STREAMLIT_REQUIREMENT = "streamlit>=1.50.0"
+MIN_STREAMLIT_VERSION = (1, 50)
+
+def streamlit_is_current() -> bool:
+    """Check that an installed Streamlit is new enough for the GUI apps."""
+    import streamlit
+    parts = streamlit.__version__.split(".")[:2]
+    try:
+        return tuple(int(part) for part in parts) >= MIN_STREAMLIT_VERSION
+    except ValueError:
+        return True  # Development builds: assume current
+
 def run_gui_demo():
     """Run the Streamlit GUI demonstration."""
     print("\n[2] Step 2: Streamlit GUI Demo")
@@ -180,11 +193,15 @@ def run_gui_demo():
     
     # Check if Streamlit is available
     try:
-        import streamlit
+        if not streamlit_is_current():
+            print("[X] Streamlit is too old for the GUI apps. Upgrading...")
+            subprocess.run([sys.executable, "-m", "pip", "install", "--upgrade", STREAMLIT_REQUIREMENT])
+            print("[!] Streamlit upgraded; restart the demo to use the new version")
+            return False
         print("[+] Streamlit available")
     except ImportError:
         print("[X] Streamlit not found. Installing...")
-        subprocess.run([sys.executable, "-m", "pip", "install", "streamlit>=1.28.0"])
+        subprocess.run([sys.executable, "-m", "pip", "install", STREAMLIT_REQUIREMENT])
         try:
             import streamlit
             print("[+] Streamlit installed successfully")
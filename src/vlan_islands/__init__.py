@@ -10,8 +10,22 @@ __author__ = "Network Analysis Tool"
 __email__ = "admin@example.com"
 
 from .models import Device, Link, VLAN, NetworkTopology
-from .analyzer import VLANIslandAnalyzer
-from .chatbot import NetworkChatbot
+
+# The analyzer (networkx) and chatbot (openai, pandas) are imported on first
+# access so that importing a light submodule such as the parser stays cheap
+_LAZY_ATTRS = {
+    "VLANIslandAnalyzer": ".analyzer",
+    "NetworkChatbot": ".chatbot",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "Device",
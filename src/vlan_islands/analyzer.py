@@ -7,8 +7,12 @@ using graph theory and connected component analysis.
 
 from typing import Dict, List, Set, Tuple, Optional, Any
 from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
+from operator import attrgetter
+import os
 import networkx as nx
 
 from .models import NetworkTopology, Device, Link, VLAN
@@ -77,12 +81,14 @@ class VLANAnalysisResult:
         """Number of devices not in the main island."""
         return self.total_devices - self.main_island_size
     
+    @cached_property
+    def island_by_device(self) -> Dict[str, VLANIsland]:
+        """Map of device ID to the island containing it, built in one pass."""
+        return {device_id: island for island in self.islands for device_id in island.devices}
+    
     def get_island_by_device(self, device_id: str) -> Optional[VLANIsland]:
         """Find which island contains a specific device."""
-        for island in self.islands:
-            if island.contains_device(device_id):
-                return island
-        return None
+        return self.island_by_device.get(device_id)
 
 
 @dataclass
@@ -110,6 +116,16 @@ class NetworkAnalysisReport:
         """VLANs without connectivity issues."""
         return [result for result in self.vlan_results if not result.has_islands]
     
+    @cached_property
+    def problematic_by_fragmentation(self) -> List[VLANAnalysisResult]:
+        """Problematic VLANs ordered from most to least fragmented."""
+        return sorted(self.problematic_vlans, key=attrgetter('fragmentation_ratio'), reverse=True)
+    
+    @cached_property
+    def results_by_vlan_id(self) -> List[VLANAnalysisResult]:
+        """All VLAN results ordered by VLAN ID."""
+        return sorted(self.vlan_results, key=attrgetter('vlan_id'))
+    
     @property
     def worst_fragmented_vlan(self) -> Optional[VLANAnalysisResult]:
         """VLAN with the highest fragmentation ratio."""
@@ -145,6 +161,11 @@ class VLANIslandAnalyzer:
             self._build_physical_graph()
         return self._physical_graph
     
+    @property
+    def vlan_by_id(self) -> Dict[int, VLAN]:
+        """VLANs in the topology keyed by VLAN ID."""
+        return self._vlan_index
+    
     def _build_physical_graph(self) -> None:
         """Build a NetworkX graph representing the physical network topology."""
         self._physical_graph = nx.Graph()
@@ -203,12 +224,16 @@ class VLANIslandAnalyzer:
         
         def dfs(node: str, component: Set[str]) -> None:
             """Depth-first search to find connected component."""
+            # Explicit stack, so long chains don't hit the interpreter's recursion limit
             visited.add(node)
-            component.add(node)
-            
-            for neighbor in graph.neighbors(node):
-                if neighbor not in visited:
-                    dfs(neighbor, component)
+            stack = [node]
+            while stack:
+                current = stack.pop()
+                component.add(current)
+                for neighbor in graph.neighbors(current):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        stack.append(neighbor)
         
         # Find all connected components
         for node in graph.nodes():
@@ -281,20 +306,47 @@ class VLANIslandAnalyzer:
             fragmentation_ratio=fragmentation_ratio
         )
     
-    def analyze_all_vlans(self) -> NetworkAnalysisReport:
+    def analyze_all_vlans(self, workers: Optional[int] = 1) -> NetworkAnalysisReport:
         """
         Analyze all VLANs in the topology for islands.
         
+        VLANs are independent, so with several workers each process builds its
+        own analyzer once and analyzes a share of them. The graph code is pure
+        Python, so processes are used rather than threads.
+        
+        Args:
+            workers: Number of worker processes (None for the CPU count);
+                1 analyzes everything in the current process
+        
         Returns:
             Complete network analysis report
+            
+        Raises:
+            ValueError: If workers is less than 1
         """
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        
         vlan_results = []
         problematic_vlans = []
         total_islands = 0
         
-        # Analyze each VLAN
-        for vlan in self.topology.vlans:
-            result = self.analyze_vlan(vlan.id)
+        vlan_ids = [vlan.id for vlan in self.topology.vlans]
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers == 1 or len(vlan_ids) <= 1:
+            results = map(self.analyze_vlan, vlan_ids)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_analyzer_worker,
+                initargs=(self.topology,)
+            ) as executor:
+                chunksize = max(1, len(vlan_ids) // (4 * workers))
+                results = list(executor.map(_analyze_one_vlan, vlan_ids, chunksize=chunksize))
+        
+        # Collect each VLAN's result
+        for result in results:
             if result:
                 vlan_results.append(result)
                 total_islands += result.island_count
@@ -468,3 +520,18 @@ class VLANIslandAnalyzer:
                     })
         
         return candidates
+
+
+# Per-process analyzer used by VLANIslandAnalyzer.analyze_all_vlans workers
+_worker_analyzer: Optional[VLANIslandAnalyzer] = None
+
+
+def _init_analyzer_worker(topology: NetworkTopology) -> None:
+    """Build the worker process's analyzer once from the pickled topology."""
+    global _worker_analyzer
+    _worker_analyzer = VLANIslandAnalyzer(topology)
+
+
+def _analyze_one_vlan(vlan_id: int) -> Optional[VLANAnalysisResult]:
+    """Analyze a single VLAN in a worker process."""
+    return _worker_analyzer.analyze_vlan(vlan_id)
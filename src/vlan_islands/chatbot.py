@@ -8,13 +8,14 @@ administrators understand and fix VLAN connectivity issues.
 import os
 import json
 import yaml
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import openai
 from dotenv import load_dotenv
+from markdown_it import MarkdownIt
 
 from .models import NetworkTopology
 from .analyzer import VLANIslandAnalyzer, NetworkAnalysisReport, VLANAnalysisResult
@@ -23,6 +24,9 @@ from .reports import ReportGenerator
 # Load environment variables
 load_dotenv()
 
+# Raw HTML in message content is escaped rather than passed through
+_MARKDOWN = MarkdownIt("commonmark", {"html": False}).enable("table")
+
 
 @dataclass
 class ChatMessage:
@@ -72,7 +76,8 @@ class NetworkChatbot:
     - Generating configuration recommendations
     """
     
-    def __init__(self, topology: NetworkTopology, analysis_report: Optional[NetworkAnalysisReport] = None, config: Optional[Dict] = None):
+    def __init__(self, topology: NetworkTopology, analysis_report: Optional[NetworkAnalysisReport] = None, config: Optional[Dict] = None,
+                 api_key: Optional[str] = None):
         """
         Initialize the chatbot with network context.
         
@@ -80,6 +85,7 @@ class NetworkChatbot:
             topology: NetworkTopology object
             analysis_report: Optional pre-computed analysis report
             config: Optional configuration dictionary from YAML file
+            api_key: OpenAI API key; falls back to the OPENAI_API_KEY environment variable
         """
         self.topology = topology
         self.analyzer = VLANIslandAnalyzer(topology)
@@ -88,7 +94,7 @@ class NetworkChatbot:
         
         # Initialize OpenAI client
         self.client = openai.OpenAI(
-            api_key=os.getenv("OPENAI_API_KEY")
+            api_key=api_key or os.getenv("OPENAI_API_KEY")
         )
         
         # Chat sessions storage
@@ -160,6 +166,23 @@ PROBLEMATIC VLANS IN THIS NETWORK:
         self.sessions[session_id] = session
         return session_id
     
+    def prune_sessions(self, max_idle: timedelta) -> int:
+        """
+        Drop chat sessions with no activity for longer than max_idle.
+        
+        Args:
+            max_idle: Idle time after which a session is discarded
+            
+        Returns:
+            Number of sessions removed
+        """
+        cutoff = datetime.now() - max_idle
+        # Snapshot first: other threads may add sessions while this runs
+        stale = [sid for sid, session in list(self.sessions.items()) if session.last_activity < cutoff]
+        for sid in stale:
+            self.sessions.pop(sid, None)
+        return len(stale)
+    
     def chat(self, session_id: str, user_message: str) -> str:
         """
         Process a user message and return AI response.
@@ -174,6 +197,58 @@ PROBLEMATIC VLANS IN THIS NETWORK:
         Raises:
             ValueError: If session doesn't exist
         """
+        session, conversation = self._prepare_conversation(session_id, user_message)
+        
+        try:
+            # Call OpenAI API
+            response = self.client.chat.completions.create(
+                messages=conversation,
+                **self._completion_options()
+            )
+            
+            return self._record_response(session, response.choices[0].message.content.strip())
+            
+        except Exception as e:
+            return self._record_error(session, e)
+    
+    def stream_chat(self, session_id: str, user_message: str) -> Iterator[str]:
+        """
+        Process a user message and yield the AI response as it is generated.
+        
+        The full response is added to the session once the stream completes.
+        
+        Args:
+            session_id: Chat session ID
+            user_message: User's message
+            
+        Yields:
+            Response text fragments in arrival order
+            
+        Raises:
+            ValueError: If session doesn't exist
+        """
+        session, conversation = self._prepare_conversation(session_id, user_message)
+        
+        parts = []
+        try:
+            stream = self.client.chat.completions.create(
+                messages=conversation,
+                stream=True,
+                **self._completion_options()
+            )
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    token = chunk.choices[0].delta.content
+                    parts.append(token)
+                    yield token
+        except Exception as e:
+            yield self._record_error(session, e)
+            return
+        
+        self._record_response(session, "".join(parts).strip())
+    
+    def _prepare_conversation(self, session_id: str, user_message: str) -> Tuple[ChatSession, List[Dict[str, str]]]:
+        """Record a user message and return the session with its API conversation."""
         if session_id not in self.sessions:
             raise ValueError(f"Session {session_id} not found")
         
@@ -188,28 +263,22 @@ PROBLEMATIC VLANS IN THIS NETWORK:
             session.add_message("system", f"Additional context: {enhanced_context}")
         
         # Get conversation history
-        conversation = session.get_conversation_history(limit=20)
-        
-        try:
-            # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=conversation,
-                temperature=0.7,
-                max_tokens=1000
-            )
-            
-            ai_response = response.choices[0].message.content.strip()
-            
-            # Add AI response to session
-            session.add_message("assistant", ai_response)
-            
-            return ai_response
-            
-        except Exception as e:
-            error_response = f"I apologize, but I encountered an error: {str(e)}. Please try rephrasing your question."
-            session.add_message("assistant", error_response)
-            return error_response
+        return session, session.get_conversation_history(limit=20)
+    
+    def _completion_options(self) -> Dict[str, Any]:
+        """Model parameters shared by every chat completion request."""
+        return {"model": "gpt-4", "temperature": 0.7, "max_tokens": 1000}
+    
+    def _record_response(self, session: ChatSession, ai_response: str) -> str:
+        """Add an AI response to the session and return it."""
+        session.add_message("assistant", ai_response)
+        return ai_response
+    
+    def _record_error(self, session: ChatSession, error: Exception) -> str:
+        """Add an apology for a failed API call to the session and return it."""
+        error_response = f"I apologize, but I encountered an error: {str(error)}. Please try rephrasing your question."
+        session.add_message("assistant", error_response)
+        return error_response
     
     def _enhance_message_with_context(self, user_message: str) -> str:
         """
@@ -397,7 +466,7 @@ Just ask me anything about your network!
         else:
             overview += f"[!] {len(report.problematic_vlans)} VLANs need attention:\n"
             
-            for result in sorted(report.problematic_vlans, key=lambda x: x.fragmentation_ratio, reverse=True)[:5]:
+            for result in report.problematic_by_fragmentation[:5]:
                 overview += f"  • VLAN {result.vlan_id} ({result.vlan_name}): {result.island_count} islands\n"
         
         overview += f"\n[!] Ask me about specific VLANs or say \"help\" for guidance on fixing issues."
@@ -405,6 +474,11 @@ Just ask me anything about your network!
         return overview.strip()
 
 
+def render_message_html(content: str) -> str:
+    """Render chat message markdown as HTML, escaping any raw HTML it contains."""
+    return _MARKDOWN.render(content)
+
+
 def create_sample_conversation() -> List[Dict[str, str]]:
     """Create a sample conversation for demonstration purposes."""
     return [
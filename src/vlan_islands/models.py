@@ -5,6 +5,7 @@ This module defines the core data structures for representing network devices,
 links, VLANs, and the overall network topology.
 """
 
+import sys
 from typing import List, Dict, Optional, Set, Any
 from pydantic import BaseModel, Field, validator
 from enum import Enum
@@ -57,7 +58,9 @@ class Device(BaseModel):
         """Ensure device ID is non-empty and valid."""
         if not v or not v.strip():
             raise ValueError("Device ID cannot be empty")
-        return v.strip()
+        # Interned so device IDs shared across links, VLANs and islands
+        # compare by identity when hashed into sets and dicts
+        return sys.intern(v.strip())
 
     def __hash__(self) -> int:
         """Make Device hashable for use in sets and as dict keys."""
@@ -92,7 +95,7 @@ class Link(BaseModel):
         """Ensure link endpoints are non-empty."""
         if not v or not v.strip():
             raise ValueError("Link endpoints cannot be empty")
-        return v.strip()
+        return sys.intern(v.strip())
 
     @validator('speed')
     def validate_speed(cls, v: str) -> str:
@@ -145,8 +148,8 @@ class VLAN(BaseModel):
 
     @validator('devices')
     def validate_devices(cls, v: List[str]) -> List[str]:
-        """Remove duplicates and empty device IDs."""
-        return list(set(device.strip() for device in v if device and device.strip()))
+        """Remove duplicates and empty device IDs, keeping first-seen order."""
+        return list(dict.fromkeys(sys.intern(device.strip()) for device in v if device and device.strip()))
 
     def get_device_set(self) -> Set[str]:
         """Get devices as a set for efficient operations."""
@@ -159,7 +162,7 @@ class VLAN(BaseModel):
     def add_device(self, device_id: str) -> None:
         """Add a device to this VLAN."""
         if device_id and device_id.strip() and device_id not in self.devices:
-            self.devices.append(device_id.strip())
+            self.devices.append(sys.intern(device_id.strip()))
 
     def remove_device(self, device_id: str) -> bool:
         """Remove a device from this VLAN. Returns True if device was removed."""
@@ -5,9 +5,9 @@ This module provides functionality to parse network topology data from JSON file
 and convert them into validated Pydantic models.
 """
 
-import json
 from pathlib import Path
-from typing import Dict, Any, Union
+from typing import Dict, Any, Optional, Union
+import orjson
 from pydantic import ValidationError
 
 from .models import NetworkTopology, Device, Link, VLAN
@@ -46,18 +46,38 @@ class NetworkTopologyParser:
             if not path.exists():
                 raise FileNotFoundError(f"Network topology file not found: {file_path}")
             
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = orjson.loads(path.read_bytes())
             
             return NetworkTopologyParser.parse_from_dict(data)
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise NetworkParseError(f"Invalid JSON format in {file_path}: {e}")
         except Exception as e:
             if isinstance(e, (NetworkParseError, FileNotFoundError)):
                 raise
             raise NetworkParseError(f"Failed to load network topology from {file_path}: {e}")
     
+    @staticmethod
+    def load_from_bytes(data: Union[bytes, bytearray, memoryview, str]) -> NetworkTopology:
+        """
+        Load network topology from in-memory JSON data.
+        
+        Args:
+            data: Raw JSON document, e.g. the contents of an uploaded file
+            
+        Returns:
+            NetworkTopology: Validated network topology object
+            
+        Raises:
+            NetworkParseError: If the data is not valid JSON or topology data
+        """
+        try:
+            parsed = orjson.loads(data)
+        except orjson.JSONDecodeError as e:
+            raise NetworkParseError(f"Invalid JSON format: {e}")
+        
+        return NetworkTopologyParser.parse_from_dict(parsed)
+    
     @staticmethod
     def parse_from_dict(data: Dict[str, Any]) -> NetworkTopology:
         """
@@ -151,8 +171,9 @@ class NetworkTopologyParser:
                 'vlans': [vlan.dict() for vlan in topology.vlans]
             }
             
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # orjson writes UTF-8 bytes directly, so no ensure_ascii pass is needed
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
                 
         except Exception as e:
             raise NetworkParseError(f"Failed to save network topology to {file_path}: {e}")
@@ -193,25 +214,29 @@ class NetworkTopologyParser:
             Dictionary containing topology summary statistics
         """
         stats = topology.get_statistics()
-        
+
+        # Build the per-VLAN summary and size extremes in a single pass
+        vlan_summary: Dict[int, Dict[str, Any]] = {}
+        largest_vlan = 0
+        smallest_vlan: Optional[int] = None
+        for vlan in topology.vlans:
+            device_count = len(vlan.devices)
+            vlan_summary[vlan.id] = {
+                'name': vlan.name,
+                'device_count': device_count,
+                'description': vlan.description
+            }
+            if device_count > largest_vlan:
+                largest_vlan = device_count
+            # Empty VLANs are ignored when looking for the smallest one
+            if device_count and (smallest_vlan is None or device_count < smallest_vlan):
+                smallest_vlan = device_count
+
         # Add additional summary information
         stats.update({
-            'vlan_summary': {
-                vlan.id: {
-                    'name': vlan.name,
-                    'device_count': len(vlan.devices),
-                    'description': vlan.description
-                }
-                for vlan in topology.vlans
-            },
-            'largest_vlan': max(
-                (len(vlan.devices) for vlan in topology.vlans),
-                default=0
-            ),
-            'smallest_vlan': min(
-                (len(vlan.devices) for vlan in topology.vlans if vlan.devices),
-                default=0
-            ),
+            'vlan_summary': vlan_summary,
+            'largest_vlan': largest_vlan,
+            'smallest_vlan': smallest_vlan or 0,
             'devices_per_location': {},
         })
         
@@ -239,3 +264,19 @@ def load_network_topology(file_path: Union[str, Path]) -> NetworkTopology:
         FileNotFoundError: If the file doesn't exist
     """
     return NetworkTopologyParser.load_from_file(file_path)
+
+
+def load_network_topology_from_bytes(data: Union[bytes, bytearray, memoryview, str]) -> NetworkTopology:
+    """
+    Convenience function to load a network topology from in-memory JSON data.
+    
+    Args:
+        data: Raw JSON document
+        
+    Returns:
+        NetworkTopology: Validated network topology object
+        
+    Raises:
+        NetworkParseError: If the data is invalid
+    """
+    return NetworkTopologyParser.load_from_bytes(data)
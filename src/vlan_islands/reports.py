@@ -5,17 +5,38 @@ This module provides functionality to export analysis results in various formats
 including JSON, CSV, and formatted text reports.
 """
 
-import json
 import csv
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, Any, List, Union, Optional
 from datetime import datetime
+import orjson
 import pandas as pd
 from tabulate import tabulate
 
 from .analyzer import NetworkAnalysisReport, VLANAnalysisResult, VLANIsland
 
 
+# Island columns used for VLANs that have no devices (and therefore no islands)
+_EMPTY_ISLAND_COLUMNS = {
+    'Island_ID': 'N/A',
+    'Island_Size': 0,
+    'Is_Main_Island': 'N/A',
+    'Island_Devices': ''
+}
+
+# JSON keys for an island and the VLANIsland attributes they are read from
+_ISLAND_JSON_KEYS = ("island_id", "devices", "device_count", "is_main_island")
+_island_json_values = attrgetter("island_id", "devices", "size", "is_main_island")
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize island device sets, which orjson cannot encode natively."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class ReportGenerator:
     """
     Generates various types of reports from VLAN island analysis results.
@@ -36,7 +57,7 @@ class ReportGenerator:
         # Convert report to serializable dictionary
         report_data = {
             "analysis_metadata": {
-                "timestamp": report.timestamp.isoformat(),
+                "timestamp": report.timestamp,
                 "total_vlans_analyzed": len(report.vlan_results),
                 "problematic_vlans_count": len(report.problematic_vlans),
                 "total_islands": report.total_islands
@@ -53,12 +74,7 @@ class ReportGenerator:
                     "isolated_devices": result.isolated_devices,
                     "fragmentation_ratio": round(result.fragmentation_ratio, 4),
                     "islands": [
-                        {
-                            "island_id": island.island_id,
-                            "devices": list(island.devices),
-                            "device_count": island.size,
-                            "is_main_island": island.is_main_island
-                        }
+                        dict(zip(_ISLAND_JSON_KEYS, _island_json_values(island)))
                         for island in result.islands
                     ]
                 }
@@ -76,15 +92,16 @@ class ReportGenerator:
             }
         }
         
-        json_str = json.dumps(report_data, indent=2, ensure_ascii=False)
+        # orjson emits UTF-8 bytes directly and serializes datetimes natively
+        json_bytes = orjson.dumps(report_data, default=_json_default, option=orjson.OPT_INDENT_2)
         
         if file_path:
             path = Path(file_path)
             path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(json_str)
+            with open(path, 'wb') as f:
+                f.write(json_bytes)
         
-        return json_str
+        return json_bytes.decode('utf-8')
     
     @staticmethod
     def generate_csv_report(report: NetworkAnalysisReport, file_path: Optional[Union[str, Path]] = None) -> str:
@@ -114,25 +131,19 @@ class ReportGenerator:
             }
             
             if result.islands:
-                for island in result.islands:
-                    row = base_row.copy()
-                    row.update({
+                csv_data.extend(
+                    {
+                        **base_row,
                         'Island_ID': island.island_id,
                         'Island_Size': island.size,
                         'Is_Main_Island': 'Yes' if island.is_main_island else 'No',
                         'Island_Devices': ';'.join(sorted(island.devices))
-                    })
-                    csv_data.append(row)
+                    }
+                    for island in result.islands
+                )
             else:
                 # VLAN with no devices
-                row = base_row.copy()
-                row.update({
-                    'Island_ID': 'N/A',
-                    'Island_Size': 0,
-                    'Is_Main_Island': 'N/A',
-                    'Island_Devices': ''
-                })
-                csv_data.append(row)
+                csv_data.append({**base_row, **_EMPTY_ISLAND_COLUMNS})
         
         if not csv_data:
             return ""
@@ -151,7 +162,7 @@ class ReportGenerator:
                 value = str(row.get(field, ''))
                 # Escape quotes and commas
                 if ',' in value or '"' in value:
-                    value = f'"{value.replace('"', '""')}"'
+                    value = '"' + value.replace('"', '""') + '"'
                 csv_row.append(value)
             csv_content.append(','.join(csv_row))
         
@@ -232,7 +243,7 @@ class ReportGenerator:
                 "-" * 40,
             ])
             
-            for result in sorted(report.problematic_vlans, key=lambda x: x.fragmentation_ratio, reverse=True):
+            for result in report.problematic_by_fragmentation:
                 lines.extend([
                     f"VLAN {result.vlan_id}: {result.vlan_name}",
                     f"  Total Devices: {result.total_devices}",
@@ -267,7 +278,9 @@ class ReportGenerator:
             
             # Create table for healthy VLANs
             healthy_data = []
-            for result in sorted(report.healthy_vlans, key=lambda x: x.vlan_id):
+            for result in report.results_by_vlan_id:
+                if result.has_islands:
+                    continue
                 healthy_data.append([
                     result.vlan_id,
                     result.vlan_name,
@@ -315,7 +328,7 @@ class ReportGenerator:
         """
         table_data = []
         
-        for result in sorted(report.vlan_results, key=lambda x: x.vlan_id):
+        for result in report.results_by_vlan_id:
             status = "[!] ISSUES" if result.has_islands else "[+] HEALTHY"
             table_data.append([
                 result.vlan_id,
@@ -5,22 +5,44 @@ This module provides functionality to create visual representations of network
 topologies with highlighted VLAN islands and connectivity issues.
 """
 
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Iterable, Optional, Union, Tuple
 from pathlib import Path
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import gzip
 import json
+import os
+import tempfile
 
-import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.collections import LineCollection
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import networkx as nx
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 import pandas as pd
+from PIL import Image
 
-from .models import NetworkTopology, Device, DeviceRole, DeviceType
+from .models import NetworkTopology, Device, Link, DeviceRole, DeviceType
 from .analyzer import NetworkAnalysisReport, VLANAnalysisResult, VLANIsland
 
 
+# Shared write_html options: load plotly.js from the CDN instead of embedding
+# ~3 MB of it in every file, and skip MathJax and figure re-validation
+_HTML_EXPORT_OPTIONS = dict(
+    include_plotlyjs='cdn',
+    include_mathjax=False,
+    validate=False,
+    full_html=True,
+)
+
+# VLAN views larger than this keep their hierarchical positions as-is
+_SPRING_LAYOUT_MAX_NODES = 500
+
+
 class NetworkVisualizer:
     """
     Creates visualizations of network topologies with VLAN island highlighting.
@@ -37,7 +59,36 @@ class NetworkVisualizer:
         self.topology = topology
         self.analysis_report = analysis_report
         self.device_colors = self._get_device_colors()
+        self._role_colors = {
+            role.value: self.device_colors.get(role.value, "#95A5A6") for role in DeviceRole
+        }
         self.role_positions = self._calculate_role_positions()
+        self._soa = self._build_device_arrays()
+        self._soa_index = {device_id: i for i, device_id in enumerate(self._soa['id'])}
+        # Links to devices missing from the topology (see validate_topology) are not drawn
+        self._links = [
+            link for link in topology.links
+            if link.source in self._soa_index and link.target in self._soa_index
+        ]
+        self._link_rows = np.array(
+            [(self._soa_index[link.source], self._soa_index[link.target]) for link in self._links],
+            dtype=np.intp
+        ).reshape(-1, 2)
+        self._hover_text = {
+            d.id: f"Device: {d.id}<br>Type: {d.type.value}<br>Role: {d.role.value}<br>Location: {d.location or 'Unknown'}"
+            for d in topology.devices
+        }
+        self._short_labels = {d.id: d.id.rsplit('-', 1)[-1] for d in topology.devices}
+        self._vlan_by_id = {v.id: v for v in topology.vlans}
+        self._vlan_result_by_id = (
+            {r.vlan_id: r for r in analysis_report.vlan_results}
+            if analysis_report else {}
+        )
+        self._links_by_vlan = self._index_links_by_vlan()
+        self._vlan_layouts = {}
+        self._static_fig = None
+        self._static_ax = None
+        self._summary_text = self._build_summary_text()
     
     def _get_device_colors(self) -> Dict[str, str]:
         """Get color mapping for different device types and roles."""
@@ -77,12 +128,9 @@ class NetworkVisualizer:
         }
         
         # Group devices by role
-        role_groups = {}
+        role_groups = defaultdict(list)
         for device in self.topology.devices:
-            role = device.role.value
-            if role not in role_groups:
-                role_groups[role] = []
-            role_groups[role].append(device)
+            role_groups[device.role.value].append(device)
         
         # Calculate positions for each role group
         for role, devices in role_groups.items():
@@ -104,11 +152,47 @@ class NetworkVisualizer:
         
         return positions
     
+    def _index_links_by_vlan(self) -> Dict[int, List[Link]]:
+        """Group links under every VLAN that contains both of their endpoints."""
+        device_vlans = defaultdict(set)
+        for vlan in self.topology.vlans:
+            for device_id in vlan.devices:
+                device_vlans[device_id].add(vlan.id)
+        
+        links_by_vlan = defaultdict(list)
+        for link in self._links:
+            shared = device_vlans.get(link.source, set()) & device_vlans.get(link.target, set())
+            for vlan_id in shared:
+                links_by_vlan[vlan_id].append(link)
+        
+        return links_by_vlan
+    
+    def _build_device_arrays(self) -> Dict[str, np.ndarray]:
+        """Lay out per-device attributes as parallel arrays indexed by device."""
+        devices = self.topology.devices
+        return {
+            'id': np.array([d.id for d in devices], dtype=object),
+            'role': np.array([d.role.value for d in devices], dtype=object),
+            'type': np.array([d.type.value for d in devices], dtype=object),
+            'location': np.array([d.location or 'Unknown' for d in devices], dtype=object),
+            'xy': np.array([self.role_positions[d.id] for d in devices], dtype=float).reshape(-1, 2),
+        }
+    
+    def _device_rows(self, G: nx.Graph) -> np.ndarray:
+        """Map the nodes of a graph to their rows in the device arrays."""
+        return np.fromiter(
+            (self._soa_index[node] for node in G.nodes()),
+            dtype=np.intp,
+            count=G.number_of_nodes()
+        )
+    
     def create_topology_visualization(
         self,
         output_path: Optional[Union[str, Path]] = None,
         format: str = "html",
-        highlight_islands: bool = True
+        highlight_islands: bool = True,
+        compress: bool = False,
+        max_nodes: int = 2000
     ) -> str:
         """
         Create a complete network topology visualization.
@@ -117,58 +201,47 @@ class NetworkVisualizer:
             output_path: Optional output file path
             format: Output format ('html', 'png', 'svg')
             highlight_islands: Whether to highlight VLAN islands
+            compress: Gzip HTML output to '<output_path>.gz'
+            max_nodes: Above this many devices, HTML output draws one node per
+                (role, location) cluster instead of one per device
             
         Returns:
             Path to the generated visualization file
         """
         if format == "html":
-            return self._create_interactive_topology(output_path, highlight_islands)
+            return self._create_interactive_topology(output_path, highlight_islands, compress, max_nodes)
         else:
             return self._create_static_topology(output_path, format, highlight_islands)
     
     def _create_interactive_topology(
         self,
         output_path: Optional[Union[str, Path]] = None,
-        highlight_islands: bool = True
+        highlight_islands: bool = True,
+        compress: bool = False,
+        max_nodes: int = 2000
     ) -> str:
         """Create an interactive HTML visualization using Plotly."""
-        # Build NetworkX graph
-        G = nx.Graph()
-        
-        # Add nodes with attributes
-        for device in self.topology.devices:
-            G.add_node(
-                device.id,
-                device_type=device.type.value,
-                role=device.role.value,
-                location=device.location,
-                color=self.device_colors.get(device.type.value, "#95A5A6")
-            )
+        title = f"Network Topology - {len(self.topology.devices)} Devices, {len(self.topology.vlans)} VLANs"
         
-        # Add edges
-        for link in self.topology.links:
-            G.add_edge(
-                link.source,
-                link.target,
-                link_type=link.type.value,
-                speed=link.speed
+        if len(self.topology.devices) > max_nodes:
+            # Too many glyphs for the browser; draw one node per cluster instead
+            edge_traces, node_traces = self._create_cluster_traces()
+            title += " (clustered by role and location)"
+        else:
+            # Every device has a hierarchical position, so draw straight from
+            # the per-device arrays without building a graph
+            xy = self._soa['xy']
+            node_traces = self._create_node_traces(
+                np.arange(len(xy)), xy, highlight_islands
             )
-        
-        # Calculate layout
-        pos = self._get_hierarchical_layout(G)
-        
-        # Prepare node traces
-        node_traces = self._create_node_traces(G, pos, highlight_islands)
-        
-        # Prepare edge traces
-        edge_traces = self._create_edge_traces(G, pos)
+            edge_traces = self._create_edge_traces(xy[self._link_rows])
         
         # Create figure
         fig = go.Figure(data=edge_traces + node_traces)
         
         fig.update_layout(
             title={
-                'text': f"Network Topology - {len(self.topology.devices)} Devices, {len(self.topology.vlans)} VLANs",
+                'text': title,
                 'x': 0.5,
                 'font': {'size': 20}
             },
@@ -197,8 +270,7 @@ class NetworkVisualizer:
         if not output_path:
             output_path = "network_topology.html"
         
-        fig.write_html(str(output_path))
-        return str(output_path)
+        return self._write_html(fig, output_path, compress)
     
     def _create_static_topology(
         self,
@@ -211,58 +283,64 @@ class NetworkVisualizer:
         G = nx.Graph()
         
         for device in self.topology.devices:
-            G.add_node(device.id, **device.dict())
+            G.add_node(
+                device.id,
+                role=device.role.value,
+                type=device.type.value,
+                location=device.location
+            )
         
-        for link in self.topology.links:
-            G.add_edge(link.source, link.target, **link.dict())
+        for link in self._links:
+            G.add_edge(
+                link.source,
+                link.target,
+                type=link.type.value,
+                speed=link.speed
+            )
         
-        # Create figure
-        plt.figure(figsize=(16, 12))
+        # Reuse the shared figure
+        ax = self._get_static_axes((16, 12))
         
         # Calculate layout
         pos = self._get_hierarchical_layout(G)
         
-        # Draw edges
-        nx.draw_networkx_edges(
-            G, pos,
-            edge_color='#CCCCCC',
-            width=1.5,
+        # Draw all edges as a single collection
+        ax.add_collection(LineCollection(
+            self._get_edge_segments(G.edges(), pos),
+            colors='#CCCCCC',
+            linewidths=1.5,
             alpha=0.7
-        )
+        ))
         
-        # Draw nodes by role
-        role_colors = {}
-        for role in DeviceRole:
-            nodes_of_role = [
-                node for node in G.nodes()
-                if G.nodes[node].get('role') == role.value
-            ]
-            if nodes_of_role:
-                color = self.device_colors.get(role.value, "#95A5A6")
-                nx.draw_networkx_nodes(
-                    G, pos,
-                    nodelist=nodes_of_role,
-                    node_color=color,
-                    node_size=800,
-                    alpha=0.8,
-                    label=role.value.title()
-                )
+        # Draw nodes by role, grouping with one pass over the role column
+        rows = self._device_rows(G)
+        node_ids = self._soa['id'][rows]
+        roles, inverse = np.unique(self._soa['role'][rows], return_inverse=True)
+        for i, role in enumerate(roles):
+            color = self._role_colors[role]
+            nx.draw_networkx_nodes(
+                G, pos,
+                nodelist=node_ids[inverse == i].tolist(),
+                node_color=color,
+                node_size=800,
+                alpha=0.8,
+                label=role.title(),
+                ax=ax
+            )
         
         # Add labels
-        labels = {node: node.split('-')[-1] for node in G.nodes()}  # Shortened labels
-        nx.draw_networkx_labels(G, pos, labels, font_size=8)
+        labels = {node: self._short_labels.get(node, node) for node in G.nodes()}
+        nx.draw_networkx_labels(G, pos, labels, font_size=8, ax=ax)
         
-        plt.title(f"Network Topology - {len(self.topology.devices)} Devices", fontsize=16)
-        plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-        plt.axis('off')
-        plt.tight_layout()
+        ax.set_title(f"Network Topology - {len(self.topology.devices)} Devices", fontsize=16)
+        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+        ax.axis('off')
         
         # Save file
         if not output_path:
             output_path = f"network_topology.{format}"
         
-        plt.savefig(str(output_path), format=format, dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_static_figure(output_path, format)
         
         return str(output_path)
     
@@ -270,7 +348,8 @@ class NetworkVisualizer:
         self,
         vlan_id: int,
         output_path: Optional[Union[str, Path]] = None,
-        format: str = "html"
+        format: str = "html",
+        compress: bool = False
     ) -> str:
         """
         Create a visualization focused on a specific VLAN and its islands.
@@ -279,33 +358,69 @@ class NetworkVisualizer:
             vlan_id: VLAN ID to visualize
             output_path: Optional output file path
             format: Output format ('html', 'png', 'svg')
+            compress: Gzip HTML output to '<output_path>.gz'
             
         Returns:
             Path to the generated visualization file
         """
         # Find the VLAN
-        vlan = next((v for v in self.topology.vlans if v.id == vlan_id), None)
+        vlan = self._vlan_by_id.get(vlan_id)
         if not vlan:
             raise ValueError(f"VLAN {vlan_id} not found")
         
         # Get analysis result if available
-        vlan_result = None
-        if self.analysis_report:
-            vlan_result = next(
-                (r for r in self.analysis_report.vlan_results if r.vlan_id == vlan_id),
-                None
-            )
+        vlan_result = self._vlan_result_by_id.get(vlan_id)
         
         if format == "html":
-            return self._create_interactive_vlan_view(vlan, vlan_result, output_path)
+            return self._create_interactive_vlan_view(vlan, vlan_result, output_path, compress)
         else:
             return self._create_static_vlan_view(vlan, vlan_result, output_path, format)
     
+    def export_all_vlans(
+        self,
+        out_dir: Union[str, Path],
+        format: str = "html",
+        workers: Optional[int] = None
+    ) -> List[str]:
+        """
+        Export a visualization for every VLAN in the topology.
+        
+        VLANs are rendered in parallel worker processes, each of which builds
+        its own visualizer once and then renders its share of the VLANs.
+        
+        Args:
+            out_dir: Directory to write the files into (created if missing)
+            format: Output format ('html', 'png', 'svg')
+            workers: Number of worker processes (defaults to the CPU count);
+                1 renders everything in the current process
+            
+        Returns:
+            Paths to the generated visualization files, in VLAN order
+        """
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        
+        jobs = [
+            (vlan.id, str(out_dir / f"vlan_{vlan.id}_topology.{format}"), format)
+            for vlan in self.topology.vlans
+        ]
+        
+        if workers == 1 or len(jobs) <= 1:
+            return [self.create_vlan_visualization(*job) for job in jobs]
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_vlan_worker,
+            initargs=(self.topology, self.analysis_report)
+        ) as executor:
+            return list(executor.map(_render_one_vlan, jobs))
+    
     def _create_interactive_vlan_view(
         self,
         vlan,
         vlan_result: Optional[VLANAnalysisResult],
-        output_path: Optional[Union[str, Path]] = None
+        output_path: Optional[Union[str, Path]] = None,
+        compress: bool = False
     ) -> str:
         """Create interactive VLAN-specific visualization."""
         # Build subgraph with only VLAN devices
@@ -315,25 +430,36 @@ class NetworkVisualizer:
         # Add VLAN devices
         for device in self.topology.devices:
             if device.id in vlan_devices:
-                G.add_node(device.id, **device.dict())
+                G.add_node(
+                    device.id,
+                    role=device.role.value,
+                    type=device.type.value,
+                    location=device.location
+                )
         
         # Add links between VLAN devices
-        for link in self.topology.links:
-            if link.source in vlan_devices and link.target in vlan_devices:
-                G.add_edge(link.source, link.target, **link.dict())
+        for link in self._links_by_vlan.get(vlan.id, []):
+            G.add_edge(
+                link.source,
+                link.target,
+                type=link.type.value,
+                speed=link.speed
+            )
         
         # Calculate layout
-        pos = nx.spring_layout(G, k=2, iterations=50)
+        pos = self._get_vlan_layout(vlan.id, G)
         
         # Create traces
-        edge_traces = self._create_edge_traces(G, pos)
+        edge_traces = self._create_edge_traces(self._get_edge_segments(G.edges(), pos))
         
         # Color nodes by island if analysis is available
         if vlan_result and vlan_result.has_islands:
             node_traces = self._create_island_node_traces(G, pos, vlan_result)
             title_suffix = f" - {vlan_result.island_count} Islands Detected"
         else:
-            node_traces = self._create_node_traces(G, pos, False)
+            rows = self._device_rows(G)
+            xy = np.array([pos[node] for node in G.nodes()], dtype=float).reshape(-1, 2)
+            node_traces = self._create_node_traces(rows, xy, False)
             title_suffix = " - Healthy"
         
         # Create figure
@@ -357,8 +483,7 @@ class NetworkVisualizer:
         if not output_path:
             output_path = f"vlan_{vlan.id}_topology.html"
         
-        fig.write_html(str(output_path))
-        return str(output_path)
+        return self._write_html(fig, output_path, compress)
     
     def _create_static_vlan_view(
         self,
@@ -376,66 +501,160 @@ class NetworkVisualizer:
             output_path = f"vlan_{vlan.id}_topology.{format}"
         
         # Placeholder implementation
-        plt.figure(figsize=(12, 8))
-        plt.text(0.5, 0.5, f"VLAN {vlan.id} Visualization\n(Static view)", 
-                ha='center', va='center', fontsize=16)
-        plt.axis('off')
-        plt.savefig(str(output_path), format=format, dpi=300, bbox_inches='tight')
-        plt.close()
+        ax = self._get_static_axes((12, 8))
+        ax.text(0.5, 0.5, f"VLAN {vlan.id} Visualization\n(Static view)", 
+                ha='center', va='center', fontsize=16, transform=ax.transAxes)
+        ax.axis('off')
+        self._save_static_figure(output_path, format)
         
         return str(output_path)
     
+    def _write_html(
+        self,
+        fig: go.Figure,
+        output_path: Union[str, Path],
+        compress: bool = False,
+        **options: Any
+    ) -> str:
+        """
+        Write a Plotly figure as HTML, replacing the target file atomically.
+        
+        The page is rendered to a temporary file in the destination directory
+        and moved into place with os.replace, so readers never see a partial
+        file. With compress=True the page is gzipped and '.gz' is appended to
+        the path.
+        
+        Returns:
+            Path to the written file
+        """
+        data = fig.to_html(**_HTML_EXPORT_OPTIONS, **options).encode('utf-8')
+        target = Path(output_path)
+        if compress:
+            data = gzip.compress(data, compresslevel=6)
+            target = target.with_name(target.name + ".gz")
+        
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            # mkstemp creates the file owner-only; match a normally written file,
+            # which gets 0o666 less the process umask (only readable by setting it)
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+            os.replace(tmp_path, target)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        
+        return str(target)
+    
+    def _save_static_figure(self, output_path: Union[str, Path], format: str, dpi: int = 300) -> None:
+        """
+        Write the shared figure to disk in a single render pass.
+        
+        PNGs are rasterized once on the Agg canvas and quantized to a paletted
+        image with Pillow; other formats go through savefig. The figure is
+        pre-sized by _get_static_axes, so no bbox_inches='tight' measuring pass
+        is needed.
+        """
+        fig = self._static_fig
+        if format == "png":
+            fig.set_dpi(dpi)
+            fig.canvas.draw()
+            image = Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).convert("RGB")
+            image.quantize(256).save(str(output_path), format="PNG", optimize=True, dpi=(dpi, dpi))
+        else:
+            fig.savefig(str(output_path), format=format, dpi=dpi)
+    
+    def _get_static_axes(self, figsize: Tuple[float, float]) -> Any:
+        """
+        Return the shared matplotlib axes, cleared and resized for a new render.
+        
+        The figure is created once per visualizer on an Agg canvas outside of
+        pyplot, so repeated static exports skip figure construction and never
+        touch pyplot's global figure registry.
+        """
+        if self._static_fig is None:
+            self._static_fig = Figure(figsize=figsize)
+            FigureCanvasAgg(self._static_fig)
+            self._static_ax = self._static_fig.add_subplot()
+            self._static_fig.subplots_adjust(left=0.02, right=0.85, top=0.94, bottom=0.02)
+        else:
+            self._static_ax.cla()
+            self._static_fig.set_size_inches(figsize)
+        
+        return self._static_ax
+    
     def _get_hierarchical_layout(self, G: nx.Graph) -> Dict[str, Tuple[float, float]]:
         """Calculate hierarchical layout based on device roles."""
         pos = {}
+        missing = []
         
         # Use pre-calculated role positions if available
         for node in G.nodes():
             if node in self.role_positions:
                 pos[node] = self.role_positions[node]
             else:
-                # Fallback to spring layout for missing nodes
-                temp_pos = nx.spring_layout(G.subgraph([node]), k=1)
-                pos[node] = temp_pos[node]
+                missing.append(node)
+        
+        # Lay out all remaining nodes with a single spring layout pass
+        if missing:
+            pos.update(nx.spring_layout(G.subgraph(missing), k=1, seed=42))
+        
+        return pos
+    
+    def _get_vlan_layout(self, vlan_id: int, G: nx.Graph) -> Dict[str, Tuple[float, float]]:
+        """
+        Return the cached spring layout for a VLAN subgraph.
+        
+        The spring simulation starts from the hierarchical role positions, so a
+        few seeded iterations are enough; very large VLANs skip it entirely.
+        """
+        if vlan_id in self._vlan_layouts:
+            return self._vlan_layouts[vlan_id]
         
+        initial = {node: self.role_positions.get(node, (0.0, 0.0)) for node in G.nodes()}
+        if G.number_of_nodes() > _SPRING_LAYOUT_MAX_NODES:
+            pos = initial
+        else:
+            pos = nx.spring_layout(G, k=2, pos=initial, iterations=10, seed=42)
+        
+        self._vlan_layouts[vlan_id] = pos
         return pos
     
     def _create_node_traces(
         self,
-        G: nx.Graph,
-        pos: Dict[str, Tuple[float, float]],
+        rows: np.ndarray,
+        xy: np.ndarray,
         highlight_islands: bool
-    ) -> List[go.Scatter]:
-        """Create Plotly traces for network nodes."""
+    ) -> List[go.Scattergl]:
+        """
+        Create Plotly traces for network nodes.
+        
+        Args:
+            rows: Rows of the devices to draw in the per-device arrays
+            xy: Node positions, one (x, y) pair per entry in rows
+            highlight_islands: Whether VLAN islands are being highlighted
+        """
         traces = []
         
-        # Group nodes by role for better visualization
-        role_groups = {}
-        for node in G.nodes():
-            role = G.nodes[node].get('role', 'unknown')
-            if role not in role_groups:
-                role_groups[role] = []
-            role_groups[role].append(node)
+        # Group nodes by role with a single pass over the device arrays
+        node_ids = self._soa['id'][rows]
+        roles, inverse = np.unique(self._soa['role'][rows], return_inverse=True)
         
         # Create trace for each role
-        for role, nodes in role_groups.items():
-            x_coords = [pos[node][0] for node in nodes]
-            y_coords = [pos[node][1] for node in nodes]
+        for i, role in enumerate(roles):
+            mask = inverse == i
+            nodes = node_ids[mask].tolist()
             
-            hover_text = []
-            for node in nodes:
-                node_data = G.nodes[node]
-                text = f"Device: {node}<br>"
-                text += f"Type: {node_data.get('type', 'Unknown')}<br>"
-                text += f"Role: {node_data.get('role', 'Unknown')}<br>"
-                text += f"Location: {node_data.get('location', 'Unknown')}"
-                hover_text.append(text)
+            hover_text = [self._hover_text[node] for node in nodes]
             
-            color = self.device_colors.get(role, "#95A5A6")
+            color = self._role_colors[role]
             
-            trace = go.Scatter(
-                x=x_coords,
-                y=y_coords,
+            trace = go.Scattergl(
+                x=xy[mask, 0],
+                y=xy[mask, 1],
                 mode='markers',
                 marker=dict(
                     size=15,
@@ -452,25 +671,33 @@ class NetworkVisualizer:
         
         return traces
     
-    def _create_edge_traces(
+    def _get_edge_segments(
         self,
-        G: nx.Graph,
+        edges: Iterable[Tuple[str, str]],
         pos: Dict[str, Tuple[float, float]]
-    ) -> List[go.Scatter]:
-        """Create Plotly traces for network edges."""
-        edge_x = []
-        edge_y = []
-        
-        for edge in G.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
-        
-        edge_trace = go.Scatter(
+    ) -> np.ndarray:
+        """Collect edge endpoint coordinates as an (edges, 2, 2) array."""
+        return np.array(
+            [(pos[source], pos[target]) for source, target in edges],
+            dtype=float
+        ).reshape(-1, 2, 2)
+    
+    def _create_edge_traces(
+        self,
+        segments: np.ndarray,
+        width: float = 2
+    ) -> List[go.Scattergl]:
+        """Create Plotly traces for network edges from an (edges, 2, 2) array."""
+        # Follow each segment with a NaN point so every edge fits in one line
+        # trace; WebGL traces break lines on NaN rather than None
+        gaps = np.full((len(segments), 1), np.nan)
+        edge_x = np.hstack([segments[:, :, 0], gaps]).ravel()
+        edge_y = np.hstack([segments[:, :, 1], gaps]).ravel()
+        
+        edge_trace = go.Scattergl(
             x=edge_x,
             y=edge_y,
-            line=dict(width=2, color='#CCCCCC'),
+            line=dict(width=width, color='#CCCCCC'),
             hoverinfo='none',
             mode='lines',
             showlegend=False
@@ -478,12 +705,68 @@ class NetworkVisualizer:
         
         return [edge_trace]
     
+    def _create_cluster_traces(self) -> Tuple[List[go.Scattergl], List[go.Scattergl]]:
+        """
+        Create edge and node traces that aggregate devices by (role, location).
+        
+        Each cluster is drawn at the centroid of its members' hierarchical
+        positions with a marker area proportional to its device count. Links
+        are collapsed to one edge per connected cluster pair. The cluster's
+        role and location are attached as customdata for drill-down handlers.
+        """
+        roles = self._soa['role']
+        locations = self._soa['location']
+        xy = self._soa['xy']
+        
+        # Label every device with its cluster in one vectorized pass
+        keys = np.array([f"{r}\x00{l}" for r, l in zip(roles, locations)], dtype=object)
+        cluster_keys, first, inverse, counts = np.unique(
+            keys, return_index=True, return_inverse=True, return_counts=True
+        )
+        centers = np.column_stack([
+            np.bincount(inverse, weights=xy[:, 0]) / counts,
+            np.bincount(inverse, weights=xy[:, 1]) / counts,
+        ])
+        cluster_roles = roles[first]
+        cluster_locations = locations[first]
+        
+        # Collapse links onto distinct cluster pairs
+        pairs = np.sort(inverse[self._link_rows], axis=1)
+        pairs = np.unique(pairs[pairs[:, 0] != pairs[:, 1]], axis=0)
+        edge_traces = self._create_edge_traces(centers[pairs], width=1)
+        
+        node_traces = []
+        for role in np.unique(cluster_roles):
+            mask = cluster_roles == role
+            role_counts = counts[mask]
+            hover_text = [
+                f"Role: {role}<br>Location: {location}<br>Devices: {count}"
+                for location, count in zip(cluster_locations[mask], role_counts)
+            ]
+            node_traces.append(go.Scattergl(
+                x=centers[mask, 0],
+                y=centers[mask, 1],
+                mode='markers',
+                marker=dict(
+                    size=np.sqrt(role_counts) * 8,
+                    color=self._role_colors[role],
+                    line=dict(width=2, color='white')
+                ),
+                customdata=np.column_stack([cluster_roles[mask], cluster_locations[mask]]),
+                hovertext=hover_text,
+                hoverinfo='text',
+                name=role.title(),
+                showlegend=True
+            ))
+        
+        return edge_traces, node_traces
+    
     def _create_island_node_traces(
         self,
         G: nx.Graph,
         pos: Dict[str, Tuple[float, float]],
         vlan_result: VLANAnalysisResult
-    ) -> List[go.Scatter]:
+    ) -> List[go.Scattergl]:
         """Create node traces colored by island membership."""
         traces = []
         
@@ -497,20 +780,17 @@ class NetworkVisualizer:
             x_coords = [pos[node][0] for node in island_nodes]
             y_coords = [pos[node][1] for node in island_nodes]
             
-            hover_text = []
-            for node in island_nodes:
-                node_data = G.nodes[node]
-                text = f"Device: {node}<br>"
-                text += f"Island: {island.island_id}<br>"
-                text += f"Status: {'Main Island' if island.is_main_island else 'Isolated'}<br>"
-                text += f"Type: {node_data.get('type', 'Unknown')}<br>"
-                text += f"Location: {node_data.get('location', 'Unknown')}"
-                hover_text.append(text)
+            # Prefix the island details onto each device's cached hover text
+            island_text = (
+                f"Island: {island.island_id}<br>"
+                f"Status: {'Main Island' if island.is_main_island else 'Isolated'}<br>"
+            )
+            hover_text = [island_text + self._hover_text[node] for node in island_nodes]
             
             color = self.device_colors["main_island"] if island.is_main_island else self.device_colors["isolated_island"]
             name = f"Island {island.island_id}" + (" (Main)" if island.is_main_island else " (Isolated)")
             
-            trace = go.Scatter(
+            trace = go.Scattergl(
                 x=x_coords,
                 y=y_coords,
                 mode='markers',
@@ -529,10 +809,10 @@ class NetworkVisualizer:
         
         return traces
     
-    def _add_analysis_annotations(self, fig: go.Figure) -> None:
-        """Add analysis summary annotations to the figure."""
+    def _build_summary_text(self) -> Optional[str]:
+        """Build the analysis summary shown on topology views."""
         if not self.analysis_report:
-            return
+            return None
         
         summary_text = f"Analysis Summary:<br>"
         summary_text += f"• Problematic VLANs: {len(self.analysis_report.problematic_vlans)}<br>"
@@ -542,8 +822,15 @@ class NetworkVisualizer:
             worst = self.analysis_report.worst_fragmented_vlan
             summary_text += f"• Worst VLAN: {worst.vlan_id} ({worst.fragmentation_ratio:.1%} fragmented)"
         
+        return summary_text
+    
+    def _add_analysis_annotations(self, fig: go.Figure) -> None:
+        """Add analysis summary annotations to the figure."""
+        if not self._summary_text:
+            return
+        
         fig.add_annotation(
-            text=summary_text,
+            text=self._summary_text,
             xref="paper", yref="paper",
             x=0.02, y=0.98,
             showarrow=False,
@@ -555,13 +842,15 @@ class NetworkVisualizer:
     
     def create_vlan_matrix_heatmap(
         self,
-        output_path: Optional[Union[str, Path]] = None
+        output_path: Optional[Union[str, Path]] = None,
+        compress: bool = False
     ) -> str:
         """
         Create a heatmap showing device participation in VLANs.
         
         Args:
             output_path: Optional output file path
+            compress: Gzip HTML output to '<output_path>.gz'
             
         Returns:
             Path to the generated heatmap file
@@ -570,19 +859,22 @@ class NetworkVisualizer:
         devices = [device.id for device in self.topology.devices]
         vlans = [vlan.id for vlan in self.topology.vlans]
         
-        matrix = []
-        for device_id in devices:
-            row = []
-            for vlan in self.topology.vlans:
-                row.append(1 if device_id in vlan.devices else 0)
-            matrix.append(row)
+        # Fill a compact uint8 matrix column by column from each VLAN's members
+        device_index = {device_id: i for i, device_id in enumerate(devices)}
+        matrix = np.zeros((len(devices), len(vlans)), dtype=np.uint8)
+        for j, vlan in enumerate(self.topology.vlans):
+            rows = [device_index[d] for d in vlan.devices if d in device_index]
+            matrix[rows, j] = 1
         
         # Create heatmap
         fig = go.Figure(data=go.Heatmap(
             z=matrix,
             x=[f"VLAN {vlan_id}" for vlan_id in vlans],
             y=devices,
+            zmin=0,
+            zmax=1,
             colorscale='RdYlBu_r',
+            zsmooth=False,
             showscale=True
         ))
         
@@ -597,5 +889,23 @@ class NetworkVisualizer:
         if not output_path:
             output_path = "vlan_matrix_heatmap.html"
         
-        fig.write_html(str(output_path))
-        return str(output_path)
+        return self._write_html(fig, output_path, compress, config={'responsive': True})
+
+
+# Per-process visualizer used by NetworkVisualizer.export_all_vlans workers
+_worker_visualizer: Optional[NetworkVisualizer] = None
+
+
+def _init_vlan_worker(
+    topology: NetworkTopology,
+    analysis_report: Optional[NetworkAnalysisReport]
+) -> None:
+    """Build the worker process's visualizer once from the pickled inputs."""
+    global _worker_visualizer
+    _worker_visualizer = NetworkVisualizer(topology, analysis_report)
+
+
+def _render_one_vlan(job: Tuple[int, str, str]) -> str:
+    """Render a single VLAN in a worker process."""
+    vlan_id, output_path, format = job
+    return _worker_visualizer.create_vlan_visualization(vlan_id, output_path, format)
@@ -7,19 +7,26 @@ Interactive chatbot with memory context, chat history, and OpenAI integration.
 
 import streamlit as st
 import sys
-import os
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional
-import json
-import yaml
+from datetime import datetime, timedelta
+from time import strftime, localtime
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+import hashlib
+import html
+import uuid
+import orjson
 
 # Add src to path
 sys.path.insert(0, str(Path("src").absolute()))
 
-from vlan_islands.parser import load_network_topology, NetworkParseError
-from vlan_islands.analyzer import VLANIslandAnalyzer
-from vlan_islands.chatbot import NetworkChatbot, ChatMessage, ChatSession
+from vlan_islands.parser import load_network_topology_from_bytes, NetworkParseError
+
+# networkx, openai and yaml are imported where they are first needed, so the
+# upload prompt renders without paying for them
+if TYPE_CHECKING:
+    from vlan_islands.analyzer import NetworkAnalysisReport
+    from vlan_islands.models import NetworkTopology
+    from vlan_islands.chatbot import NetworkChatbot
 
 # Page configuration
 st.set_page_config(
@@ -30,70 +37,12 @@ st.set_page_config(
 )
 
 # Custom CSS for better visibility and light theme
-st.markdown("""
-<style>
-    /* Force light theme */
-    .stApp {
-        background-color: white !important;
-        color: black !important;
-    }
-    
-    /* Improve sidebar visibility */
-    .stSidebar {
-        background-color: #f8f9fa !important;
-    }
-    
-    .stSidebar .stTextInput input {
-        background-color: white !important;
-        color: black !important;
-        border: 1px solid #ddd !important;
-    }
-    
-    /* Improve main content visibility */
-    .stTextInput input {
-        background-color: white !important;
-        color: black !important;
-        border: 1px solid #ddd !important;
-    }
-    
-    /* Chat input styling */
-    .stChatInput input {
-        background-color: white !important;
-        color: black !important;
-        border: 1px solid #ddd !important;
-    }
-    
-    /* Chat message styling */
-    .stChatMessage {
-        background-color: white !important;
-        color: black !important;
-        border: 1px solid #e6e6e6 !important;
-        border-radius: 8px !important;
-        margin: 10px 0 !important;
-        padding: 10px !important;
-    }
-    
-    /* Ensure text is visible */
-    .stMarkdown, .stText, p, div {
-        color: black !important;
-    }
-    
-    /* Button styling */
-    .stButton button {
-        background-color: #007bff !important;
-        color: white !important;
-        border: none !important;
-    }
-    
-    /* Metric styling */
-    .stMetric {
-        background-color: #f8f9fa !important;
-        border: 1px solid #ddd !important;
-        border-radius: 4px !important;
-        padding: 10px !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_data(show_spinner=False)
+def load_css() -> str:
+    """Read the app stylesheet once per process."""
+    return (Path(__file__).parent / "static" / "app.css").read_text(encoding="utf-8")
+
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
 
 def initialize_session_state():
     """Initialize Streamlit session state variables."""
@@ -109,6 +58,10 @@ def initialize_session_state():
         st.session_state.chat_messages = []
     if 'openai_api_key' not in st.session_state:
         st.session_state.openai_api_key = ""
+    if 'recommendations_md' not in st.session_state:
+        st.session_state.recommendations_md = ""
+    if 'worst_vlan_label' not in st.session_state:
+        st.session_state.worst_vlan_label = None
 
 def display_chat_message(message: Dict[str, str], is_user: bool = True):
     """Display a single chat message using Streamlit's native chat interface."""
@@ -120,26 +73,90 @@ def display_chat_message(message: Dict[str, str], is_user: bool = True):
         if message.get('timestamp'):
             st.caption(f"⏰ {message['timestamp']}")
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def render_history_html(messages: Tuple[Tuple[str, str, str], ...]) -> str:
+    """Render earlier (role, content, timestamp) messages as one HTML blob."""
+    from vlan_islands.chatbot import render_message_html
+    
+    parts = []
+    for role, content, timestamp in messages:
+        avatar, name = ("👤", "You") if role == 'user' else ("🤖", "AI Assistant")
+        # Raw HTML in the content is escaped by the markdown renderer
+        parts.append(f'<div class="stChatMessage">\n<strong>{avatar} {name}</strong>\n'
+                     f'{render_message_html(content)}')
+        if timestamp:
+            parts.append(f'<small>⏰ {html.escape(timestamp)}</small>\n')
+        parts.append('</div>\n')
+    return ''.join(parts)
+
+@st.cache_data(show_spinner=False)
+def build_welcome_message(problematic_count: int, total_islands: int) -> str:
+    """Build the welcome message shown before the first chat turn."""
+    return f"""
+    Welcome! I'm your network troubleshooting assistant. I've analyzed your network and found **{problematic_count} problematic VLANs with {total_islands} total islands**. 
+    
+    Ask me anything about your VLAN connectivity issues, and I'll provide detailed guidance!
+    """
+
+def _ts() -> str:
+    """Current local time formatted for chat message timestamps."""
+    return strftime("%H:%M:%S", localtime())
+
+def export_chat_history(messages: List[Dict], exported_at: datetime) -> bytes:
+    """Serialize the chat history for download; only called when the button is clicked."""
+    chat_data = {
+        "timestamp": exported_at.isoformat(),
+        "messages": messages
+    }
+    return orjson.dumps(chat_data, option=orjson.OPT_INDENT_2)
+
+def add_chat_message(container, role: str, content: str, timestamp: Optional[str] = None) -> None:
+    """Record a chat message and draw it at the end of the chat container."""
+    message = {
+        'role': role,
+        'content': content,
+        'timestamp': timestamp or _ts()
+    }
+    st.session_state.chat_messages.append(message)
+    with container:
+        display_chat_message(message, role == 'user')
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _parse_and_analyze(file_hash: str, _file_bytes: bytes) -> Tuple["NetworkTopology", "NetworkAnalysisReport"]:
+    """
+    Parse and analyze an uploaded topology, shared across sessions.
+    
+    Keyed on the content hash only; the leading underscore keeps Streamlit
+    from hashing the raw bytes again.
+    """
+    from vlan_islands.analyzer import VLANIslandAnalyzer
+    
+    topology = load_network_topology_from_bytes(_file_bytes)
+    report = VLANIslandAnalyzer(topology).analyze_all_vlans()
+    return topology, report
+
+def prepare_quick_action_text(report: "NetworkAnalysisReport") -> None:
+    """Build the quick-action strings once per report instead of on every rerun."""
+    st.session_state.recommendations_md = "🔧 **Key Recommendations:**\n\n" + "\n".join(
+        f"• {rec}" for rec in report.recommendations[:5]
+    )
+    worst = report.worst_fragmented_vlan
+    st.session_state.worst_vlan_label = f"🔍 Analyze VLAN {worst.vlan_id}" if worst else None
+
 def load_network_data(uploaded_file) -> bool:
     """Load network topology from uploaded file."""
     try:
         if uploaded_file is not None:
-            # Save uploaded file temporarily
-            with open("temp_network.json", "wb") as f:
-                f.write(uploaded_file.getbuffer())
+            file_bytes = uploaded_file.getvalue()
+            file_hash = hashlib.blake2b(file_bytes).hexdigest()
             
-            # Load topology
-            topology = load_network_topology("temp_network.json")
-            st.session_state.topology = topology
-            
-            # Analyze network
+            # Load and analyze network
             with st.spinner("Analyzing network topology..."):
-                analyzer = VLANIslandAnalyzer(topology)
-                report = analyzer.analyze_all_vlans()
-                st.session_state.analysis_report = report
-            
-            # Clean up temp file
-            os.remove("temp_network.json")
+                topology, report = _parse_and_analyze(file_hash, file_bytes)
+            st.session_state.topology = topology
+            st.session_state.analysis_report = report
+            st.session_state.topology_hash = file_hash
+            prepare_quick_action_text(report)
             
             return True
     except NetworkParseError as e:
@@ -149,12 +166,20 @@ def load_network_data(uploaded_file) -> bool:
     
     return False
 
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
+def _read_chatbot_config() -> Dict:
+    """Read and parse the chatbot YAML configuration (cached across reruns)."""
+    import yaml
+    
+    # Prefer libyaml's C loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open("chatbot_config.yaml", "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=loader)
+
 def load_chatbot_config() -> Dict:
     """Load chatbot configuration from YAML file."""
     try:
-        with open("chatbot_config.yaml", "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-        return config
+        return _read_chatbot_config()
     except Exception as e:
         st.error(f"Error loading chatbot config: {e}")
         # Return default config
@@ -164,6 +189,38 @@ def load_chatbot_config() -> Dict:
             "specialties": []
         }
 
+# Chat sessions of closed browser tabs are dropped from the shared chatbot after this long
+_CHAT_SESSION_MAX_IDLE = timedelta(hours=2)
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _make_chatbot(api_key_hash: str, topology_id: str, report_id: str,
+                  _api_key: str, _topology: "NetworkTopology", _report: "NetworkAnalysisReport",
+                  _config: Dict) -> "NetworkChatbot":
+    """
+    Build a NetworkChatbot shared across browser sessions.
+    
+    Keyed on cheap identifiers only, so the OpenAI client and its connection
+    pool are reused instead of being rebuilt for every session. The key is
+    passed to the client directly, never through the process environment,
+    so concurrent sessions cannot swap credentials.
+    """
+    from vlan_islands.chatbot import NetworkChatbot
+    
+    return NetworkChatbot(_topology, _report, config=_config, api_key=_api_key)
+
+def new_chat_session(chatbot: "NetworkChatbot", previous_id: Optional[str] = None) -> str:
+    """Start a chat session with an ID unique across browser sessions sharing the chatbot."""
+    if previous_id:
+        chatbot.sessions.pop(previous_id, None)
+    chatbot.prune_sessions(_CHAT_SESSION_MAX_IDLE)
+    return chatbot.create_session(f"session_{uuid.uuid4().hex}")
+
+def ensure_chat_session(chatbot: "NetworkChatbot") -> str:
+    """Return this browser session's chat session, starting a new one if it was pruned."""
+    if st.session_state.chat_session_id not in chatbot.sessions:
+        st.session_state.chat_session_id = new_chat_session(chatbot)
+    return st.session_state.chat_session_id
+
 def initialize_chatbot(api_key: str) -> bool:
     """Initialize the AI chatbot with the provided API key."""
     try:
@@ -175,24 +232,26 @@ def initialize_chatbot(api_key: str) -> bool:
             st.warning("Please upload a network topology file first.")
             return False
         
-        # Set API key in environment
-        os.environ["OPENAI_API_KEY"] = api_key
-        
-        # Load chatbot configuration
-        config = load_chatbot_config()
+        # Reuse the configuration this session already loaded
+        config = st.session_state.get("chatbot_config") or load_chatbot_config()
         
-        # Initialize chatbot with custom config
-        chatbot = NetworkChatbot(
-            st.session_state.topology, 
+        # Shared by every browser session with the same key and topology
+        api_key_hash = hashlib.blake2b(api_key.encode("utf-8"), digest_size=16).hexdigest()
+        topology_id = st.session_state.get("topology_hash") or str(id(st.session_state.topology))
+        chatbot = _make_chatbot(
+            api_key_hash,
+            topology_id,
+            str(id(st.session_state.analysis_report)),
+            api_key,
+            st.session_state.topology,
             st.session_state.analysis_report,
-            config=config
+            config
         )
         st.session_state.chatbot = chatbot
         st.session_state.chatbot_config = config
         
         # Create chat session
-        session_id = chatbot.create_session()
-        st.session_state.chat_session_id = session_id
+        st.session_state.chat_session_id = new_chat_session(chatbot)
         
         return True
         
@@ -210,16 +269,121 @@ def process_chat_command(user_input: str) -> Optional[str]:
         
         # Create new chat session
         if st.session_state.chatbot:
-            session_id = st.session_state.chatbot.create_session()
-            st.session_state.chat_session_id = session_id
+            st.session_state.chat_session_id = new_chat_session(
+                st.session_state.chatbot, st.session_state.chat_session_id
+            )
         
         return "Chat history cleared. Starting fresh conversation."
     
     return None
 
+
+@st.fragment
+def chat_fragment(chatbot: "NetworkChatbot", report: "NetworkAnalysisReport"):
+    """
+    Chat history, input and quick actions.
+    
+    Sending a message or pressing a quick action reruns only this fragment,
+    leaving the sidebar (uploader, metrics, config) untouched.
+    """
+    messages = st.session_state.chat_messages
+    
+    st.subheader("💬 Chat with AI Assistant")
+    
+    # Chat container with messages; new messages are appended to it in place
+    # instead of rerunning the script to redraw the whole history
+    chat_container = st.container()
+    
+    with chat_container:
+        if not messages:
+            # Welcome message
+            with st.chat_message("assistant", avatar="🤖"):
+                st.write(build_welcome_message(len(report.problematic_vlans), report.total_islands))
+        
+        # Earlier history goes out as a single element; only the latest
+        # message uses the live chat_message component
+        if len(messages) > 1:
+            history = tuple((m['role'], m['content'], m.get('timestamp', '')) for m in messages[:-1])
+            st.html(render_history_html(history))
+        if messages:
+            display_chat_message(messages[-1], messages[-1]['role'] == 'user')
+    
+    # Chat input using Streamlit's native chat input (auto-submits on Enter)
+    user_input = st.chat_input(
+        placeholder="Ask me about your network... (type /clear to reset chat)",
+        key="chat_input"
+    )
+    
+    # Process input when user presses Enter
+    if user_input and user_input.strip():
+        # Check for commands first
+        command_response = process_chat_command(user_input.strip())
+        
+        if command_response:
+            # The history was cleared, so the page must be redrawn from scratch
+            add_chat_message(chat_container, 'assistant', command_response)
+            st.rerun()
+        else:
+            # Add user message to history; both halves of the turn share one timestamp
+            timestamp = _ts()
+            add_chat_message(chat_container, 'user', user_input.strip(), timestamp)
+            
+            # Stream the AI response into the page as tokens arrive
+            with chat_container, st.chat_message("AI Assistant", avatar="🤖"):
+                try:
+                    response = st.write_stream(chatbot.stream_chat(
+                        ensure_chat_session(chatbot),
+                        user_input.strip()
+                    ))
+                except Exception as e:
+                    st.error(f"Error getting AI response: {e}")
+                    response = f"Sorry, I encountered an error: {e}"
+                
+                # Add assistant response to history
+                st.caption(f"⏰ {timestamp}")
+                messages.append({
+                    'role': 'assistant',
+                    'content': response,
+                    'timestamp': timestamp
+                })
+    
+    # Quick action buttons
+    if report and report.problematic_vlans and report.worst_fragmented_vlan:
+        st.markdown("---")
+        st.subheader("🚀 Quick Actions")
+        if not st.session_state.recommendations_md:
+            prepare_quick_action_text(report)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            if st.button("📊 Show Network Overview"):
+                overview = chatbot.get_network_overview()
+                add_chat_message(chat_container, 'assistant', overview)
+        
+        with col2:
+            worst_vlan = report.worst_fragmented_vlan
+            if st.button(st.session_state.worst_vlan_label):
+                analysis = chatbot.analyze_vlan_interactive(worst_vlan.vlan_id)
+                add_chat_message(chat_container, 'assistant', analysis)
+        
+        with col3:
+            if st.button("💡 Get Recommendations"):
+                add_chat_message(chat_container, 'assistant', st.session_state.recommendations_md)
+        
+        # Run all quick actions together; none of them needs an OpenAI round-trip
+        if st.button("⚡ Run All Quick Actions"):
+            for content in (
+                chatbot.get_network_overview(),
+                chatbot.analyze_vlan_interactive(worst_vlan.vlan_id),
+                st.session_state.recommendations_md,
+            ):
+                add_chat_message(chat_container, 'assistant', content)
+
 def main():
     """Main Streamlit application."""
     initialize_session_state()
+    ss = st.session_state
     
     # Header
     st.title("🤖 VLAN Islands AI Assistant")
@@ -234,19 +398,22 @@ def main():
         api_key = st.text_input(
             "Enter your OpenAI API Key:",
             type="password",
-            value=st.session_state.openai_api_key,
+            value=ss.openai_api_key,
             help="Required for AI chatbot functionality. Get your key from https://platform.openai.com/api-keys",
             placeholder="sk-..."
         )
+        # Re-pasting the same key with stray whitespace is not a change
+        api_key = (api_key or "").strip()
         
-        if api_key and api_key != st.session_state.openai_api_key:
+        if api_key and api_key != ss.openai_api_key:
             st.success("✅ API key updated!")
         elif not api_key:
             st.warning("⚠️ Please enter your OpenAI API key to enable the chatbot.")
         
-        if api_key != st.session_state.openai_api_key:
-            st.session_state.openai_api_key = api_key
-            st.session_state.chatbot = None  # Reset chatbot when API key changes
+        if api_key != ss.openai_api_key:
+            ss.openai_api_key = api_key
+            if ss.chatbot is None or ss.chatbot.client.api_key != api_key:
+                ss.chatbot = None  # Reset chatbot when API key changes
         
         st.markdown("---")
         
@@ -258,16 +425,15 @@ def main():
             help="Upload your network topology file to start analysis"
         )
         
-        if uploaded_file is not None and st.session_state.topology is None:
+        if uploaded_file is not None and ss.topology is None:
             if load_network_data(uploaded_file):
                 st.success("✅ Network topology loaded successfully!")
-                st.rerun()
         
         # Network summary
-        if st.session_state.analysis_report:
+        report = ss.analysis_report
+        if report:
             st.markdown("---")
             st.subheader("📊 Network Summary")
-            report = st.session_state.analysis_report
             
             col1, col2 = st.columns(2)
             with col1:
@@ -286,32 +452,28 @@ def main():
         # Chat controls
         st.subheader("💬 Chat Controls")
         if st.button("🗑️ Clear Chat History"):
-            st.session_state.chat_messages = []
-            if st.session_state.chatbot:
-                session_id = st.session_state.chatbot.create_session()
-                st.session_state.chat_session_id = session_id
+            ss.chat_messages = []
+            if ss.chatbot:
+                ss.chat_session_id = new_chat_session(ss.chatbot, ss.chat_session_id)
             st.success("Chat history cleared!")
-            st.rerun()
         
         # Export chat
-        if st.session_state.chat_messages:
-            chat_data = {
-                "timestamp": datetime.now().isoformat(),
-                "messages": st.session_state.chat_messages
-            }
+        messages = ss.chat_messages
+        if messages:
+            now = datetime.now()
             
             st.download_button(
                 "💾 Export Chat History",
-                data=json.dumps(chat_data, indent=2),
-                file_name=f"chat_history_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                data=lambda: export_chat_history(messages, now),
+                file_name=f"chat_history_{now.strftime('%Y%m%d_%H%M%S')}.json",
                 mime="application/json"
             )
         
         # AI Specialties
-        if 'chatbot_config' in st.session_state and st.session_state.chatbot_config.get('specialties'):
+        if 'chatbot_config' in ss and ss.chatbot_config.get('specialties'):
             st.markdown("---")
             st.subheader("🧠 AI Specialties")
-            for specialty in st.session_state.chatbot_config['specialties'][:4]:  # Show first 4
+            for specialty in ss.chatbot_config['specialties'][:4]:  # Show first 4
                 st.markdown(f"**{specialty['name']}**")
                 st.caption(specialty['description'])
         
@@ -330,135 +492,24 @@ def main():
         """)
     
     # Main chat interface
-    if st.session_state.topology is None:
+    if ss.topology is None:
         st.info("👈 Please upload a network topology file in the sidebar to get started.")
         return
     
-    if not st.session_state.openai_api_key:
+    if not ss.openai_api_key:
         st.warning("👈 Please enter your OpenAI API key in the sidebar to enable the chatbot.")
         return
     
     # Initialize chatbot if needed
-    if st.session_state.chatbot is None:
+    if ss.chatbot is None:
         with st.spinner("Initializing AI assistant..."):
-            if not initialize_chatbot(st.session_state.openai_api_key):
+            if not initialize_chatbot(ss.openai_api_key):
                 return
         st.success("🤖 AI Assistant ready!")
-        st.rerun()
-    
-    # Display chat messages
-    st.subheader("💬 Chat with AI Assistant")
-    
-    # Chat container with messages
-    chat_container = st.container()
+    chatbot = ss.chatbot
     
-    with chat_container:
-        if not st.session_state.chat_messages:
-            # Welcome message
-            with st.chat_message("assistant", avatar="🤖"):
-                st.write(f"""
-                Welcome! I'm your network troubleshooting assistant. I've analyzed your network and found **{len(st.session_state.analysis_report.problematic_vlans)} problematic VLANs with {st.session_state.analysis_report.total_islands} total islands**. 
-                
-                Ask me anything about your VLAN connectivity issues, and I'll provide detailed guidance!
-                """)
-        
-        # Display chat history
-        for message in st.session_state.chat_messages:
-            display_chat_message(message, message['role'] == 'user')
-    
-    # Chat input using Streamlit's native chat input (auto-submits on Enter)
-    user_input = st.chat_input(
-        placeholder="Ask me about your network... (type /clear to reset chat)",
-        key="chat_input"
-    )
-    
-    # Process input when user presses Enter
-    if user_input and user_input.strip():
-        # Check for commands first
-        command_response = process_chat_command(user_input.strip())
-        
-        if command_response:
-            # Add command response
-            st.session_state.chat_messages.append({
-                'role': 'assistant',
-                'content': command_response,
-                'timestamp': datetime.now().strftime("%H:%M:%S")
-            })
-            st.rerun()
-        else:
-            # Add user message to history
-            st.session_state.chat_messages.append({
-                'role': 'user',
-                'content': user_input.strip(),
-                'timestamp': datetime.now().strftime("%H:%M:%S")
-            })
-            
-            # Get AI response
-            with st.spinner("🤖 Thinking..."):
-                try:
-                    response = st.session_state.chatbot.chat(
-                        st.session_state.chat_session_id, 
-                        user_input.strip()
-                    )
-                    
-                    # Add assistant response to history
-                    st.session_state.chat_messages.append({
-                        'role': 'assistant',
-                        'content': response,
-                        'timestamp': datetime.now().strftime("%H:%M:%S")
-                    })
-                    
-                except Exception as e:
-                    st.error(f"Error getting AI response: {e}")
-                    st.session_state.chat_messages.append({
-                        'role': 'assistant',
-                        'content': f"Sorry, I encountered an error: {e}",
-                        'timestamp': datetime.now().strftime("%H:%M:%S")
-                    })
-            
-            st.rerun()
-    
-    # Quick action buttons
-    if st.session_state.analysis_report and st.session_state.analysis_report.problematic_vlans:
-        st.markdown("---")
-        st.subheader("🚀 Quick Actions")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            if st.button("📊 Show Network Overview"):
-                overview = st.session_state.chatbot.get_network_overview()
-                st.session_state.chat_messages.append({
-                    'role': 'assistant',
-                    'content': overview,
-                    'timestamp': datetime.now().strftime("%H:%M:%S")
-                })
-                st.rerun()
-        
-        with col2:
-            worst_vlan = st.session_state.analysis_report.worst_fragmented_vlan
-            if st.button(f"🔍 Analyze VLAN {worst_vlan.vlan_id}"):
-                analysis = st.session_state.chatbot.analyze_vlan_interactive(worst_vlan.vlan_id)
-                st.session_state.chat_messages.append({
-                    'role': 'assistant',
-                    'content': analysis,
-                    'timestamp': datetime.now().strftime("%H:%M:%S")
-                })
-                st.rerun()
-        
-        with col3:
-            if st.button("💡 Get Recommendations"):
-                recommendations = "\n".join([
-                    "🔧 **Key Recommendations:**",
-                    ""
-                ] + [f"• {rec}" for rec in st.session_state.analysis_report.recommendations[:5]])
-                
-                st.session_state.chat_messages.append({
-                    'role': 'assistant',
-                    'content': recommendations,
-                    'timestamp': datetime.now().strftime("%H:%M:%S")
-                })
-                st.rerun()
+    # Chat history, input and quick actions rerun on their own
+    chat_fragment(chatbot, report)
 
 if __name__ == "__main__":
     main()
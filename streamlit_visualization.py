@@ -7,21 +7,37 @@ Interactive dashboards for network topology visualization and analytics.
 
 import streamlit as st
 import sys
-import os
 from pathlib import Path
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import networkx as nx
+import numpy as np
 from typing import Dict, List, Optional, Tuple
+import hashlib
 import json
+from collections import Counter
+
+try:
+    import igraph as ig
+    _HAS_IGRAPH = True
+except ImportError:
+    _HAS_IGRAPH = False
+
+try:
+    from scipy.spatial import cKDTree
+    _HAS_SCIPY = True
+except ImportError:
+    _HAS_SCIPY = False
+
+# Above this many devices node labels are left to the hover text
+_NODE_LABEL_MAX_NODES = 300
 
 # Add src to path
 sys.path.insert(0, str(Path("src").absolute()))
 
-from vlan_islands.parser import load_network_topology, NetworkParseError
-from vlan_islands.analyzer import VLANIslandAnalyzer
+from vlan_islands.parser import load_network_topology_from_bytes, NetworkParseError
+from vlan_islands.analyzer import VLANIslandAnalyzer, NetworkAnalysisReport
 from vlan_islands.reports import ReportGenerator, create_island_summary_dataframe
 
 # Page configuration
@@ -40,28 +56,36 @@ def initialize_session_state():
         st.session_state.analysis_report = None
     if 'analyzer' not in st.session_state:
         st.session_state.analyzer = None
+    if 'topology_hash' not in st.session_state:
+        st.session_state.topology_hash = None
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _analyze(file_hash: str, _file_bytes: bytes):
+    """
+    Parse and analyze an uploaded topology, shared across reruns and sessions.
+    
+    Keyed on the content hash only; the leading underscore keeps Streamlit
+    from hashing the raw bytes again.
+    """
+    topology = load_network_topology_from_bytes(_file_bytes)
+    analyzer = VLANIslandAnalyzer(topology)
+    report = analyzer.analyze_all_vlans()
+    return topology, analyzer, report
 
 def load_network_data(uploaded_file) -> bool:
     """Load network topology from uploaded file."""
     try:
         if uploaded_file is not None:
-            # Save uploaded file temporarily
-            with open("temp_network.json", "wb") as f:
-                f.write(uploaded_file.getbuffer())
-            
-            # Load topology
-            topology = load_network_topology("temp_network.json")
-            st.session_state.topology = topology
+            file_bytes = uploaded_file.getvalue()
+            file_hash = hashlib.blake2b(file_bytes).hexdigest()
             
-            # Analyze network
+            # Load and analyze network
             with st.spinner("Analyzing network topology..."):
-                analyzer = VLANIslandAnalyzer(topology)
-                report = analyzer.analyze_all_vlans()
-                st.session_state.analysis_report = report
-                st.session_state.analyzer = analyzer
-            
-            # Clean up temp file
-            os.remove("temp_network.json")
+                topology, analyzer, report = _analyze(file_hash, file_bytes)
+            st.session_state.topology = topology
+            st.session_state.analysis_report = report
+            st.session_state.analyzer = analyzer
+            st.session_state.topology_hash = file_hash
             
             return True
     except NetworkParseError as e:
@@ -71,87 +95,197 @@ def load_network_data(uploaded_file) -> bool:
     
     return False
 
-def create_network_topology_graph(analyzer: VLANIslandAnalyzer, highlight_vlan: Optional[int] = None):
-    """Create interactive network topology visualization."""
-    G = analyzer.physical_graph
-    
-    # Calculate layout
-    pos = nx.spring_layout(G, k=3, iterations=50, seed=42)
-    
-    # Prepare node data
-    node_x = []
-    node_y = []
-    node_text = []
-    node_colors = []
-    node_sizes = []
-    
-    # Color mapping for device roles
-    role_colors = {
-        'core': '#1B4332',
-        'distribution': '#2D6A4F', 
-        'access': '#52B788',
-        'edge': '#74C69D',
-        'wifi': '#FF6B6B',
-        'storage': '#4ECDC4'
-    }
-    
-    for node in G.nodes():
-        x, y = pos[node]
-        node_x.append(x)
-        node_y.append(y)
+# The graph caches below are keyed on the upload's content hash (graph_key); the
+# graph itself is passed as _G so Streamlit never hashes it
+
+@st.cache_data(show_spinner=False)
+def _graph_arrays(graph_key: str, _G: nx.Graph) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """Node list, edge endpoint indices and node roles, extracted from the graph once."""
+    G = _G
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    n_edges = G.number_of_edges()
+    ei = np.fromiter((index[u] for u, _ in G.edges()), dtype=np.int32, count=n_edges)
+    ej = np.fromiter((index[v] for _, v in G.edges()), dtype=np.int32, count=n_edges)
+    roles = np.array([G.nodes[node].get('role', 'unknown') for node in nodes], dtype=object)
+    return nodes, ei, ej, roles
+
+def _cutoff_fr_layout(graph_key: str, G: nx.Graph, iterations: int = 50, seed: int = 42) -> Dict[str, np.ndarray]:
+    """
+    Fruchterman-Reingold with repulsion limited to a cutoff radius.
+    
+    Neighbouring nodes are found with a k-d tree each iteration, so a step costs
+    roughly O((V + E) log V) instead of the all-pairs O(V^2) of nx.spring_layout.
+    """
+    nodes, ei, ej, _ = _graph_arrays(graph_key, G)
+    n_nodes = len(nodes)
+    if n_nodes < 3:
+        return nx.spring_layout(G, seed=seed)
+    
+    edges = np.column_stack((ei, ej))[ei != ej]
+    pos = np.random.default_rng(seed).uniform(0, 1, size=(n_nodes, 2))
+    
+    k = 1.0 / np.sqrt(n_nodes)  # Optimal distance between nodes in the unit square
+    cutoff = 2 * k
+    temperature = 0.1
+    cooling = temperature / (iterations + 1)
+    
+    for _ in range(iterations):
+        disp = np.zeros_like(pos)
         
-        node_data = G.nodes[node]
-        role = node_data.get('role', 'unknown')
-        device_type = node_data.get('device_type', 'unknown')
-        location = node_data.get('location', 'unknown')
+        # Local repulsion, k^2 / d, only between nodes closer than the cutoff
+        pairs = cKDTree(pos).query_pairs(cutoff, output_type='ndarray')
+        delta = pos[pairs[:, 0]] - pos[pairs[:, 1]]
+        dist = np.maximum(np.hypot(delta[:, 0], delta[:, 1]), 0.01)
+        force = delta * (k * k / dist ** 2)[:, None]
+        np.add.at(disp, pairs[:, 0], force)
+        np.add.at(disp, pairs[:, 1], -force)
         
-        # Node text for hover
-        text = f"Device: {node}<br>Type: {device_type}<br>Role: {role}<br>Location: {location}"
+        # Attraction along links, d^2 / k
+        delta = pos[edges[:, 0]] - pos[edges[:, 1]]
+        dist = np.maximum(np.hypot(delta[:, 0], delta[:, 1]), 0.01)
+        force = delta * (dist / k)[:, None]
+        np.add.at(disp, edges[:, 0], -force)
+        np.add.at(disp, edges[:, 1], force)
         
-        # Check if device is in highlighted VLAN
-        if highlight_vlan:
-            vlan = next((v for v in analyzer.topology.vlans if v.id == highlight_vlan), None)
-            if vlan and node in vlan.devices:
-                # Color by island if VLAN has issues
-                vlan_result = analyzer.analyze_vlan(highlight_vlan)
-                if vlan_result and vlan_result.has_islands:
-                    island = vlan_result.get_island_by_device(node)
-                    if island:
-                        if island.is_main_island:
-                            node_colors.append('#2ECC71')  # Green for main island
-                            text += f"<br><b>Main Island {island.island_id}</b>"
-                        else:
-                            node_colors.append('#E74C3C')  # Red for isolated
-                            text += f"<br><b>Isolated Island {island.island_id}</b>"
-                        node_sizes.append(20)
-                    else:
-                        node_colors.append('#95A5A6')  # Gray for not in VLAN
-                        node_sizes.append(10)
-                else:
-                    node_colors.append('#2ECC71')  # Green for healthy VLAN
-                    node_sizes.append(15)
+        # Limit each step to the current temperature
+        length = np.maximum(np.hypot(disp[:, 0], disp[:, 1]), 0.01)
+        pos += disp * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+    
+    return dict(zip(nodes, nx.rescale_layout(pos)))
+
+@st.cache_data(show_spinner=False)
+def _compute_layout(graph_key: str, _G: nx.Graph) -> Dict[str, Tuple[float, float]]:
+    """Force-directed layout, computed once per distinct topology."""
+    G = _G
+    if not _HAS_IGRAPH:
+        if _HAS_SCIPY:
+            return _cutoff_fr_layout(graph_key, G)
+        return nx.spring_layout(G, k=3, iterations=50, seed=42)
+    
+    # igraph's Fruchterman-Reingold runs in C; a seeded starting layout keeps it deterministic
+    nodes, ei, ej, _ = _graph_arrays(graph_key, G)
+    ig_graph = ig.Graph(n=len(nodes), edges=np.column_stack((ei, ej)).tolist())
+    start = np.random.default_rng(42).uniform(-1, 1, size=(len(nodes), 2)).tolist()
+    layout = ig_graph.layout_fruchterman_reingold(niter=50, seed=start)
+    coords = nx.rescale_layout(np.asarray(layout.coords, dtype=float))
+    return dict(zip(nodes, coords))
+
+@st.cache_data(show_spinner=False)
+def _build_static_traces(graph_key: str, _G: nx.Graph):
+    """Node and edge line coordinates in G.nodes() order; independent of any highlight."""
+    pos = _compute_layout(graph_key, _G)
+    nodes, ei, ej, _ = _graph_arrays(graph_key, _G)
+    
+    # Four decimals is far below a pixel; float32 halves the bytes sent to the browser
+    n_nodes = len(nodes)
+    node_xy = np.fromiter(
+        (coord for node in nodes for coord in pos[node]), dtype=float, count=2 * n_nodes
+    ).reshape(n_nodes, 2).round(4).astype(np.float32)
+    
+    # One (x0, x1, NaN) run per edge in a preallocated buffer; NaN breaks the line
+    edge_xy = np.empty((3 * len(ei), 2), dtype=np.float32)
+    edge_xy[0::3] = node_xy[ei]
+    edge_xy[1::3] = node_xy[ej]
+    edge_xy[2::3] = np.nan
+    
+    return node_xy, edge_xy[:, 0], edge_xy[:, 1]
+
+# Color mapping for device roles
+_ROLE_COLORS = {
+    'core': '#1B4332',
+    'distribution': '#2D6A4F', 
+    'access': '#52B788',
+    'edge': '#74C69D',
+    'wifi': '#FF6B6B',
+    'storage': '#4ECDC4'
+}
+
+@st.cache_data(show_spinner=False)
+def _topology_traces_plain(graph_key: str, _G: nx.Graph) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Hover text, role colours and sizes for the un-highlighted topology."""
+    nodes, _, _, roles = _graph_arrays(graph_key, _G)
+    node_attrs = _G.nodes
+    
+    # Node text for hover
+    node_text = [
+        f"Device: {node}<br>Type: {node_attrs[node].get('device_type', 'unknown')}"
+        f"<br>Role: {role}<br>Location: {node_attrs[node].get('location', 'unknown')}"
+        for node, role in zip(nodes, roles)
+    ]
+    
+    # Color by role
+    node_colors = np.vectorize(_ROLE_COLORS.get, otypes=['U7'])(roles, '#95A5A6')
+    node_sizes = np.full(len(roles), 15, dtype=np.int8)
+    return node_text, node_colors, node_sizes
+
+def _topology_traces_highlighted(graph_key: str, G: nx.Graph, vlan, vlan_result) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Hover text, colours and sizes with one VLAN's islands highlighted."""
+    nodes = _graph_arrays(graph_key, G)[0]
+    n_nodes = len(nodes)
+    node_text = list(_topology_traces_plain(graph_key, G)[0])
+    
+    # Gray for not in VLAN
+    node_colors = np.full(n_nodes, '#95A5A6', dtype='U7')
+    node_sizes = np.full(n_nodes, 10, dtype=np.int8)
+    if vlan is None:
+        return node_text, node_colors, node_sizes
+    
+    vlan_devices = set(vlan.devices)
+    in_vlan = np.fromiter((node in vlan_devices for node in nodes), dtype=bool, count=n_nodes)
+    
+    if vlan_result and vlan_result.has_islands:
+        # Color by island if VLAN has issues
+        device_to_island = vlan_result.island_by_device
+        is_main = np.zeros(n_nodes, dtype=bool)
+        is_isolated = np.zeros(n_nodes, dtype=bool)
+        for i in np.flatnonzero(in_vlan):
+            island = device_to_island.get(nodes[i])
+            if island is None:
+                continue
+            if island.is_main_island:
+                is_main[i] = True
+                node_text[i] += f"<br><b>Main Island {island.island_id}</b>"
             else:
-                node_colors.append('#95A5A6')  # Gray for not in VLAN
-                node_sizes.append(10)
-        else:
-            # Color by role
-            node_colors.append(role_colors.get(role, '#95A5A6'))
-            node_sizes.append(15)
+                is_isolated[i] = True
+                node_text[i] += f"<br><b>Isolated Island {island.island_id}</b>"
         
-        node_text.append(text)
+        node_colors[is_main] = '#2ECC71'  # Green for main island
+        node_colors[is_isolated] = '#E74C3C'  # Red for isolated
+        node_sizes[is_main | is_isolated] = 20
+    else:
+        node_colors[in_vlan] = '#2ECC71'  # Green for healthy VLAN
+        node_sizes[in_vlan] = 15
+    
+    return node_text, node_colors, node_sizes
+
+def create_network_topology_graph(analyzer: VLANIslandAnalyzer, graph_key: str, highlight_vlan: Optional[int] = None):
+    """
+    Create interactive network topology visualization.
     
-    # Prepare edge data
-    edge_x = []
-    edge_y = []
+    graph_key identifies the analyzer's topology (the upload's content hash)
+    and keys every cached layout and styling step.
+    """
+    G = analyzer.physical_graph
     
-    for edge in G.edges():
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
+    # Layout and edges are cached; only the node colouring depends on the highlight
+    node_xy, edge_x, edge_y = _build_static_traces(graph_key, G)
+    node_x = node_xy[:, 0]
+    node_y = node_xy[:, 1]
+    nodes = _graph_arrays(graph_key, G)[0]
+    n_nodes = len(nodes)
     
-    # Create traces
-    edge_trace = go.Scatter(
+    vlan = None
+    if highlight_vlan:
+        vlan = analyzer.vlan_by_id.get(highlight_vlan)
+        vlan_result = analyzer.analyze_vlan(highlight_vlan) if vlan else None
+        node_text, node_colors, node_sizes = _topology_traces_highlighted(graph_key, G, vlan, vlan_result)
+    else:
+        node_text, node_colors, node_sizes = _topology_traces_plain(graph_key, G)
+    
+    # Create traces (WebGL, so large topologies don't bloat the SVG DOM)
+    edge_trace = go.Scattergl(
         x=edge_x, y=edge_y,
         line=dict(width=2, color='#CCCCCC'),
         hoverinfo='none',
@@ -159,11 +293,12 @@ def create_network_topology_graph(analyzer: VLANIslandAnalyzer, highlight_vlan:
         showlegend=False
     )
     
-    node_trace = go.Scatter(
+    show_labels = n_nodes <= _NODE_LABEL_MAX_NODES
+    node_trace = go.Scattergl(
         x=node_x, y=node_y,
-        mode='markers+text',
+        mode='markers+text' if show_labels else 'markers',
         hoverinfo='text',
-        text=[node.split('-')[-1] for node in G.nodes()],  # Shortened labels
+        text=[node.split('-')[-1] for node in nodes] if show_labels else None,  # Shortened labels
         textposition="middle center",
         textfont=dict(size=8, color="white"),
         hovertext=node_text,
@@ -179,10 +314,8 @@ def create_network_topology_graph(analyzer: VLANIslandAnalyzer, highlight_vlan:
     fig = go.Figure(data=[edge_trace, node_trace])
     
     title = "Network Topology"
-    if highlight_vlan:
-        vlan = next((v for v in analyzer.topology.vlans if v.id == highlight_vlan), None)
-        if vlan:
-            title += f" - VLAN {highlight_vlan} ({vlan.name})"
+    if vlan:
+        title += f" - VLAN {highlight_vlan} ({vlan.name})"
     
     fig.update_layout(
         title=title,
@@ -206,8 +339,35 @@ def create_network_topology_graph(analyzer: VLANIslandAnalyzer, highlight_vlan:
     
     return fig
 
-def create_vlan_summary_chart(report):
-    """Create VLAN summary bar chart."""
+@st.cache_data(show_spinner=False, max_entries=8)
+def _problematic_df(report_key: str, _report: NetworkAnalysisReport) -> pd.DataFrame:
+    """Problematic VLANs table, worst fragmentation first."""
+    results = _report.problematic_by_fragmentation
+    return pd.DataFrame({
+        'VLAN ID': [r.vlan_id for r in results],
+        'Name': [r.vlan_name for r in results],
+        'Devices': [r.total_devices for r in results],
+        'Islands': [r.island_count for r in results],
+        'Main Island': [r.main_island_size for r in results],
+        'Isolated': [r.isolated_devices for r in results],
+        'Fragmentation': [f"{r.fragmentation_ratio:.1%}" for r in results]
+    })
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _healthy_df(report_key: str, _report: NetworkAnalysisReport) -> pd.DataFrame:
+    """Healthy VLANs table, ordered by VLAN ID."""
+    healthy = [r for r in _report.results_by_vlan_id if not r.has_islands]
+    return pd.DataFrame({
+        'VLAN ID': [r.vlan_id for r in healthy],
+        'Name': [r.vlan_name for r in healthy],
+        'Devices': [r.total_devices for r in healthy],
+        'Status': ['✅ Connected' if r.total_devices > 0 else '⚪ Empty' for r in healthy]
+    })
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _report_df(report_key: str, _report: NetworkAnalysisReport) -> pd.DataFrame:
+    """Per-VLAN summary table shared by the report charts, keyed on the upload's content hash."""
+    report = _report
     data = []
     
     for result in report.vlan_results:
@@ -220,57 +380,71 @@ def create_vlan_summary_chart(report):
             'Status': 'Problematic' if result.has_islands else 'Healthy'
         })
     
-    df = pd.DataFrame(data)
-    
-    # Create bar chart
-    fig = px.bar(
-        df,
-        x='VLAN ID',
-        y='Islands',
-        color='Status',
-        color_discrete_map={'Healthy': '#2ECC71', 'Problematic': '#E74C3C'},
-        title='VLAN Islands Summary',
-        hover_data=['VLAN Name', 'Total Devices', 'Fragmentation %']
-    )
+    return pd.DataFrame(data)
+
+_STATUS_COLORS = {'Healthy': '#2ECC71', 'Problematic': '#E74C3C'}
+
+def create_vlan_summary_chart(df: pd.DataFrame):
+    """Create VLAN summary bar chart."""
+    # Create bar chart, one trace per status so the legend matches the colours
+    fig = go.Figure()
+    for status in df['Status'].unique():
+        part = df[df['Status'] == status]
+        fig.add_trace(go.Bar(
+            x=part['VLAN ID'].to_numpy(),
+            y=part['Islands'].to_numpy(),
+            name=status,
+            legendgroup=status,
+            marker_color=_STATUS_COLORS[status],
+            customdata=part[['VLAN Name', 'Total Devices', 'Fragmentation %']].to_numpy(),
+            hovertemplate=f"Status={status}<br>VLAN ID=%{{x}}<br>Islands=%{{y}}"
+                          "<br>VLAN Name=%{customdata[0]}<br>Total Devices=%{customdata[1]}"
+                          "<br>Fragmentation %=%{customdata[2]}<extra></extra>"
+        ))
     
     fig.update_layout(
+        title='VLAN Islands Summary',
         xaxis_title="VLAN ID",
         yaxis_title="Number of Islands",
+        legend_title_text='Status',
+        barmode='relative',
         height=400
     )
     
     return fig
 
-def create_fragmentation_scatter(report):
+def create_fragmentation_scatter(df: pd.DataFrame):
     """Create fragmentation vs devices scatter plot."""
-    data = []
-    
-    for result in report.vlan_results:
-        data.append({
-            'VLAN ID': result.vlan_id,
-            'VLAN Name': result.vlan_name,
-            'Total Devices': result.total_devices,
-            'Fragmentation %': result.fragmentation_ratio * 100,
-            'Islands': result.island_count,
-            'Status': 'Problematic' if result.has_islands else 'Healthy'
-        })
-    
-    df = pd.DataFrame(data)
-    
-    fig = px.scatter(
-        df,
-        x='Total Devices',
-        y='Fragmentation %',
-        color='Status',
-        size='Islands',
-        hover_data=['VLAN ID', 'VLAN Name'],
-        color_discrete_map={'Healthy': '#2ECC71', 'Problematic': '#E74C3C'},
-        title='VLAN Fragmentation Analysis'
-    )
+    # Marker area scales with island count, largest marker 20px across
+    sizeref = float(df['Islands'].max()) / (20 ** 2) if len(df) else 1
+    
+    fig = go.Figure()
+    for status in df['Status'].unique():
+        part = df[df['Status'] == status]
+        fig.add_trace(go.Scattergl(
+            x=part['Total Devices'].to_numpy(),
+            y=part['Fragmentation %'].to_numpy(),
+            mode='markers',
+            name=status,
+            legendgroup=status,
+            marker=dict(
+                color=_STATUS_COLORS[status],
+                size=part['Islands'].to_numpy(),
+                sizemode='area',
+                sizeref=sizeref
+            ),
+            customdata=part[['VLAN ID', 'VLAN Name']].to_numpy(),
+            hovertemplate=f"Status={status}<br>Total Devices=%{{x}}<br>Fragmentation %=%{{y}}"
+                          "<br>Islands=%{marker.size}<br>VLAN ID=%{customdata[0]}"
+                          "<br>VLAN Name=%{customdata[1]}<extra></extra>"
+        ))
     
     fig.update_layout(
+        title='VLAN Fragmentation Analysis',
         xaxis_title="Total Devices in VLAN",
         yaxis_title="Fragmentation Percentage",
+        legend_title_text='Status',
+        legend_itemsizing='constant',
         height=400
     )
     
@@ -278,39 +452,33 @@ def create_fragmentation_scatter(report):
 
 def create_device_type_distribution(topology):
     """Create device type distribution pie chart."""
-    device_counts = {}
-    for device in topology.devices:
-        device_type = device.type.value
-        device_counts[device_type] = device_counts.get(device_type, 0) + 1
+    device_counts = Counter(device.type.value for device in topology.devices)
     
-    fig = px.pie(
+    fig = go.Figure(go.Pie(
         values=list(device_counts.values()),
-        names=list(device_counts.keys()),
-        title='Device Type Distribution'
-    )
+        labels=list(device_counts.keys()),
+        hovertemplate="label=%{label}<br>value=%{value}<extra></extra>"
+    ))
     
-    fig.update_layout(height=400)
+    fig.update_layout(title='Device Type Distribution', height=400)
     return fig
 
 def create_location_heatmap(topology, report):
     """Create location-based problem heatmap."""
-    location_problems = {}
-    location_devices = {}
+    location_problems = Counter()
+    device_by_id = {d.id: d for d in topology.devices}
     
     # Count devices per location
-    for device in topology.devices:
-        location = device.location
-        location_devices[location] = location_devices.get(location, 0) + 1
+    location_devices = Counter(d.location for d in topology.devices)
     
     # Count problems per location
     for result in report.problematic_vlans:
         for island in result.islands:
             if not island.is_main_island:  # Count isolated devices
                 for device_id in island.devices:
-                    device = next((d for d in topology.devices if d.id == device_id), None)
+                    device = device_by_id.get(device_id)
                     if device:
-                        location = device.location
-                        location_problems[location] = location_problems.get(location, 0) + 1
+                        location_problems[device.location] += 1
     
     # Create data for heatmap
     locations = list(location_devices.keys())
@@ -320,61 +488,47 @@ def create_location_heatmap(topology, report):
     # Calculate problem ratio
     problem_ratios = [p/d if d > 0 else 0 for p, d in zip(problem_counts, device_counts)]
     
-    fig = px.bar(
+    fig = go.Figure(go.Bar(
         x=locations,
         y=problem_counts,
-        color=problem_ratios,
-        color_continuous_scale='Reds',
-        title='Problem Devices by Location',
-        labels={'x': 'Location', 'y': 'Isolated Devices', 'color': 'Problem Ratio'}
-    )
+        marker=dict(
+            color=problem_ratios,
+            colorscale='Reds',
+            colorbar=dict(title='Problem Ratio')
+        ),
+        hovertemplate="Location=%{x}<br>Isolated Devices=%{y}<br>Problem Ratio=%{marker.color}<extra></extra>"
+    ))
     
     fig.update_layout(
+        title='Problem Devices by Location',
+        xaxis_title='Location',
+        yaxis_title='Isolated Devices',
         height=400,
         xaxis={'tickangle': 45}
     )
     
     return fig
 
-def create_vlan_islands_weather(report):
+# Weather buckets by fragmentation ratio: exactly 0, then [0, 0.2), [0.2, 0.5), [0.5, 0.8), [0.8, ...)
+_WEATHER_EDGES = np.array([np.nextafter(0, 1), 0.2, 0.5, 0.8])
+_WEATHER = np.array(['Sunny', 'Partly Cloudy', 'Cloudy', 'Stormy', 'Hurricane'], dtype=object)
+_WEATHER_COLORS = np.array([
+    '#FFD700',  # Gold
+    '#87CEEB',  # Sky Blue
+    '#708090',  # Slate Gray
+    '#FF4500',  # Orange Red
+    '#DC143C'  # Crimson
+], dtype=object)
+_WEATHER_ICONS = np.array(['☀️', '⛅', '☁️', '⛈️', '🌪️'], dtype=object)
+
+def create_vlan_islands_weather(report_df: pd.DataFrame):
     """Create VLAN islands weather visualization - showing network health like weather."""
     # Create weather-like categories based on fragmentation
-    weather_data = []
-    
-    for result in report.vlan_results:
-        if result.fragmentation_ratio == 0:
-            weather = "Sunny"
-            color = "#FFD700"  # Gold
-            icon = "☀️"
-        elif result.fragmentation_ratio < 0.2:
-            weather = "Partly Cloudy" 
-            color = "#87CEEB"  # Sky Blue
-            icon = "⛅"
-        elif result.fragmentation_ratio < 0.5:
-            weather = "Cloudy"
-            color = "#708090"  # Slate Gray
-            icon = "☁️"
-        elif result.fragmentation_ratio < 0.8:
-            weather = "Stormy"
-            color = "#FF4500"  # Orange Red
-            icon = "⛈️"
-        else:
-            weather = "Hurricane"
-            color = "#DC143C"  # Crimson
-            icon = "🌪️"
-        
-        weather_data.append({
-            'VLAN ID': result.vlan_id,
-            'VLAN Name': result.vlan_name,
-            'Weather': weather,
-            'Fragmentation': result.fragmentation_ratio * 100,
-            'Islands': result.island_count,
-            'Devices': result.total_devices,
-            'Color': color,
-            'Icon': icon
-        })
-    
-    df = pd.DataFrame(weather_data)
+    df = report_df.rename(columns={'Total Devices': 'Devices', 'Fragmentation %': 'Fragmentation'})
+    bucket = np.digitize(df['Fragmentation'].to_numpy() / 100, _WEATHER_EDGES)
+    df['Weather'] = _WEATHER[bucket]
+    df['Color'] = _WEATHER_COLORS[bucket]
+    df['Icon'] = _WEATHER_ICONS[bucket]
     
     # Create sunburst chart showing weather distribution
     fig = make_subplots(
@@ -399,7 +553,7 @@ def create_vlan_islands_weather(report):
     
     # Fragmentation storm map (scatter)
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=df['Devices'],
             y=df['Fragmentation'],
             mode='markers+text',
@@ -435,7 +589,7 @@ def create_vlan_islands_weather(report):
     # VLAN weather timeline (sorted by VLAN ID)
     df_sorted = df.sort_values('VLAN ID')
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=df_sorted['VLAN ID'],
             y=df_sorted['Fragmentation'],
             mode='markers+lines',
@@ -470,6 +624,19 @@ def create_vlan_islands_weather(report):
     
     return fig
 
+@st.fragment
+def _topology_section(analyzer: VLANIslandAnalyzer, graph_key: str, vlan_options: List[Tuple[str, Optional[int]]]):
+    """Highlight selector and topology chart; reruns on its own when the selection changes."""
+    selected_vlan = st.selectbox(
+        "Highlight VLAN in topology:",
+        options=vlan_options,
+        format_func=lambda x: x[0],
+        help="Select a VLAN to highlight its islands in the network topology"
+    )
+    
+    topology_fig = create_network_topology_graph(analyzer, graph_key, selected_vlan[1])
+    st.plotly_chart(topology_fig, use_container_width=True)
+
 def main():
     """Main Streamlit application."""
     initialize_session_state()
@@ -509,57 +676,34 @@ def main():
                 worst = report.worst_fragmented_vlan
                 st.error(f"🚨 Worst: VLAN {worst.vlan_id} ({worst.fragmentation_ratio:.1%})")
         
-        # Visualization controls
-        if st.session_state.analysis_report:
-            st.markdown("---")
-            st.header("🎛️ Visualization Controls")
-            
-            # VLAN selection for topology highlighting
-            vlan_options = [("None", None)] + [
-                (f"VLAN {v.id} ({v.name})", v.id) 
-                for v in st.session_state.topology.vlans
-            ]
-            
-            selected_vlan = st.selectbox(
-                "Highlight VLAN in topology:",
-                options=vlan_options,
-                format_func=lambda x: x[0],
-                help="Select a VLAN to highlight its islands in the network topology"
-            )
-            
-            highlight_vlan_id = selected_vlan[1] if selected_vlan[1] is not None else None
-        
         # Export options
         if st.session_state.analysis_report:
             st.markdown("---")
             st.header("💾 Export Data")
             
-            # Generate reports
+            # Reports are generated only when their button is clicked
             report = st.session_state.analysis_report
             
             # JSON report
-            json_report = ReportGenerator.generate_json_report(report)
             st.download_button(
                 "📄 Download JSON Report",
-                data=json_report,
+                data=lambda: ReportGenerator.generate_json_report(report),
                 file_name="vlan_analysis_report.json",
                 mime="application/json"
             )
             
             # CSV report
-            csv_report = ReportGenerator.generate_csv_report(report)
             st.download_button(
                 "📊 Download CSV Report",
-                data=csv_report,
+                data=lambda: ReportGenerator.generate_csv_report(report),
                 file_name="vlan_analysis_report.csv",
                 mime="text/csv"
             )
             
             # Text report
-            text_report = ReportGenerator.generate_text_report(report)
             st.download_button(
                 "📝 Download Text Report",
-                data=text_report,
+                data=lambda: ReportGenerator.generate_text_report(report),
                 file_name="vlan_analysis_report.txt",
                 mime="text/plain"
             )
@@ -645,29 +789,30 @@ def main():
     # Network topology visualization
     st.subheader("🌐 Network Topology")
     
-    if 'highlight_vlan_id' in locals():
-        topology_fig = create_network_topology_graph(analyzer, highlight_vlan_id)
-    else:
-        topology_fig = create_network_topology_graph(analyzer)
-    
-    st.plotly_chart(topology_fig, use_container_width=True)
+    # VLAN selection for topology highlighting
+    vlan_options = [("None", None)] + [
+        (f"VLAN {v.id} ({v.name})", v.id) 
+        for v in st.session_state.topology.vlans
+    ]
+    _topology_section(analyzer, st.session_state.topology_hash, vlan_options)
     
     # VLAN analysis charts
+    report_df = _report_df(st.session_state.topology_hash, report)
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("📊 VLAN Islands Summary")
-        vlan_summary_fig = create_vlan_summary_chart(report)
+        vlan_summary_fig = create_vlan_summary_chart(report_df)
         st.plotly_chart(vlan_summary_fig, use_container_width=True)
     
     with col2:
         st.subheader("🎯 Fragmentation Analysis")
-        fragmentation_fig = create_fragmentation_scatter(report)
+        fragmentation_fig = create_fragmentation_scatter(report_df)
         st.plotly_chart(fragmentation_fig, use_container_width=True)
     
     # VLAN Islands Weather Map
     st.subheader("🌤️ VLAN Islands Weather Map")
-    weather_fig = create_vlan_islands_weather(report)
+    weather_fig = create_vlan_islands_weather(report_df)
     st.plotly_chart(weather_fig, use_container_width=True)
     
     # Additional analytics
@@ -690,53 +835,39 @@ def main():
     
     with tab1:
         if report.problematic_vlans:
-            problematic_data = []
-            for result in sorted(report.problematic_vlans, key=lambda x: x.fragmentation_ratio, reverse=True):
-                problematic_data.append({
-                    'VLAN ID': result.vlan_id,
-                    'Name': result.vlan_name,
-                    'Devices': result.total_devices,
-                    'Islands': result.island_count,
-                    'Main Island': result.main_island_size,
-                    'Isolated': result.isolated_devices,
-                    'Fragmentation': f"{result.fragmentation_ratio:.1%}"
-                })
-            
-            st.dataframe(problematic_data, use_container_width=True)
+            st.dataframe(_problematic_df(st.session_state.topology_hash, report), use_container_width=True)
         else:
             st.success("🎉 No problematic VLANs found!")
     
     with tab2:
-        if report.healthy_vlans:
-            healthy_data = []
-            for result in sorted(report.healthy_vlans, key=lambda x: x.vlan_id):
-                healthy_data.append({
-                    'VLAN ID': result.vlan_id,
-                    'Name': result.vlan_name,
-                    'Devices': result.total_devices,
-                    'Status': '✅ Connected' if result.total_devices > 0 else '⚪ Empty'
-                })
-            
-            st.dataframe(healthy_data, use_container_width=True)
+        healthy_df = _healthy_df(st.session_state.topology_hash, report)
+        if not healthy_df.empty:
+            st.dataframe(healthy_df, use_container_width=True)
         else:
             st.warning("No healthy VLANs found.")
     
     with tab3:
         if report.problematic_vlans:
-            island_data = []
+            vlan_ids, names, island_ids, types, sizes, previews = [], [], [], [], [], []
             for result in report.problematic_vlans:
                 for island in result.islands:
-                    island_data.append({
-                        'VLAN ID': result.vlan_id,
-                        'VLAN Name': result.vlan_name,
-                        'Island ID': island.island_id,
-                        'Type': 'Main' if island.is_main_island else 'Isolated',
-                        'Size': island.size,
-                        'Devices': ', '.join(sorted(list(island.devices))[:3]) + 
-                                  (f' ... (+{island.size-3} more)' if island.size > 3 else '')
-                    })
+                    size = island.size
+                    vlan_ids.append(result.vlan_id)
+                    names.append(result.vlan_name)
+                    island_ids.append(island.island_id)
+                    types.append('Main' if island.is_main_island else 'Isolated')
+                    sizes.append(size)
+                    previews.append(', '.join(sorted(island.devices)[:3]) +
+                                    (f' ... (+{size-3} more)' if size > 3 else ''))
             
-            island_df = pd.DataFrame(island_data)
+            island_df = pd.DataFrame({
+                'VLAN ID': vlan_ids,
+                'VLAN Name': names,
+                'Island ID': island_ids,
+                'Type': types,
+                'Size': sizes,
+                'Devices': previews
+            })
             st.dataframe(island_df, use_container_width=True)
         else:
             st.info("No islands to display.")
@@ -0,0 +1,58 @@
+"""
+Reference union-find used by the tests as an independent connectivity oracle.
+"""
+
+from array import array
+from typing import Dict, List, FrozenSet
+
+from vlan_islands.models import NetworkTopology
+
+
+class UnionFind:
+    """Disjoint-set forest with path halving and union by size."""
+
+    def __init__(self, n: int):
+        # Machine-int arrays: 4 bytes per slot instead of a boxed int per list entry
+        self.parent = array("i", range(n))
+        self.size = array("i", [1]) * n
+
+    def find(self, x: int) -> int:
+        """Return the root of x, halving the path on the way up."""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> None:
+        """Merge the sets of a and b, hanging the smaller tree under the larger."""
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+
+
+def expected_components(topology: NetworkTopology, vlan_id: int) -> List[FrozenSet[str]]:
+    """
+    Connected components of a VLAN's devices, computed from the raw links.
+
+    Only links with both endpoints in the VLAN count, matching the analyzer's
+    VLAN subgraph.
+    """
+    vlan = next(v for v in topology.vlans if v.id == vlan_id)
+    devices = list(dict.fromkeys(vlan.devices))
+    index: Dict[str, int] = {device: i for i, device in enumerate(devices)}
+
+    uf = UnionFind(len(devices))
+    for link in topology.links:
+        a, b = index.get(link.source), index.get(link.target)
+        if a is not None and b is not None:
+            uf.union(a, b)
+
+    groups: Dict[int, List[str]] = {}
+    for device, i in index.items():
+        groups.setdefault(uf.find(i), []).append(device)
+    return [frozenset(group) for group in groups.values()]
@@ -0,0 +1,17 @@
+"""
+Shared test helpers for the VLAN Islands test suite.
+"""
+
+from vlan_islands.models import Device, Link, DeviceType, DeviceRole, LinkType
+
+
+def make_device(*, id: str, type: DeviceType = DeviceType.SWITCH, role: DeviceRole = DeviceRole.ACCESS,
+                location: str = "lab") -> Device:
+    """Build a Device without running validators, for tests that don't exercise them."""
+    return Device.model_construct(id=id, type=type, role=role, location=location)
+
+
+def make_link(*, source: str, target: str, type: LinkType = LinkType.ETHERNET, speed: str = "1G") -> Link:
+    """Build a Link without running validators, for tests that don't exercise them."""
+    return Link.model_construct(source=source, target=target, type=type, speed=speed)
+
@@ -5,207 +5,216 @@ These tests verify the correctness of the island detection algorithm
 using various network topologies and edge cases.
 """
 
+import functools
+import operator
+from functools import reduce
+
 import pytest
 from typing import List, Dict, Any
 
-from vlan_islands.models import NetworkTopology, Device, Link, VLAN, DeviceType, DeviceRole, LinkType
+from vlan_islands.models import NetworkTopology, Device, VLAN, DeviceType, DeviceRole
 from vlan_islands.analyzer import VLANIslandAnalyzer, VLANIsland, VLANAnalysisResult
 
+from .conftest import make_device, make_link
+from ._uf import expected_components
+
+
+# The builders' literals are known to be valid, so devices and links skip field
+# validation (make_device / make_link)
+@functools.lru_cache(maxsize=None)
+def create_simple_topology() -> NetworkTopology:
+    """Create a simple test topology with known island structure."""
+    devices = [
+        make_device(id="sw1", role=DeviceRole.CORE, location="datacenter"),
+        make_device(id="sw2", role=DeviceRole.DISTRIBUTION, location="building-a"),
+        make_device(id="sw3", role=DeviceRole.ACCESS, location="building-a"),
+        make_device(id="sw4", role=DeviceRole.ACCESS, location="building-b"),
+        make_device(id="sw5", role=DeviceRole.ACCESS, location="building-b"),
+    ]
+
+    links = [
+        make_link(source="sw1", target="sw2", speed="10G"),
+        make_link(source="sw2", target="sw3", speed="1G"),
+        # Note: sw4 and sw5 are connected to each other but not to the main network
+        make_link(source="sw4", target="sw5", speed="1G"),
+    ]
+
+    vlans = [
+        VLAN(id=100, name="Test-VLAN", description="Test VLAN with islands", 
+             devices=["sw1", "sw2", "sw3", "sw4", "sw5"]),
+        VLAN(id=200, name="Healthy-VLAN", description="Healthy VLAN", 
+             devices=["sw1", "sw2", "sw3"]),
+        VLAN(id=300, name="Empty-VLAN", description="Empty VLAN", devices=[]),
+    ]
+
+    return NetworkTopology(devices=devices, links=links, vlans=vlans)
+
+@functools.lru_cache(maxsize=None)
+def create_complex_topology() -> NetworkTopology:
+    """Create a more complex topology with multiple island scenarios."""
+    devices = [
+        # Core layer
+        make_device(id="core1", role=DeviceRole.CORE, location="datacenter"),
+        make_device(id="core2", role=DeviceRole.CORE, location="datacenter"),
+
+        # Distribution layer
+        make_device(id="dist1", role=DeviceRole.DISTRIBUTION, location="building-a"),
+        make_device(id="dist2", role=DeviceRole.DISTRIBUTION, location="building-a"),
+        make_device(id="dist3", role=DeviceRole.DISTRIBUTION, location="building-b"),
+
+        # Access layer
+        make_device(id="acc1", role=DeviceRole.ACCESS, location="building-a-floor1"),
+        make_device(id="acc2", role=DeviceRole.ACCESS, location="building-a-floor2"),
+        make_device(id="acc3", role=DeviceRole.ACCESS, location="building-b-floor1"),
+        make_device(id="acc4", role=DeviceRole.ACCESS, location="building-b-floor2"),
+
+        # Isolated devices
+        make_device(id="isolated1", role=DeviceRole.ACCESS, location="remote"),
+        make_device(id="isolated2", role=DeviceRole.ACCESS, location="remote"),
+    ]
+
+    links = [
+        # Core interconnection
+        make_link(source="core1", target="core2", speed="40G"),
+
+        # Core to distribution
+        make_link(source="core1", target="dist1", speed="10G"),
+        make_link(source="core2", target="dist2", speed="10G"),
+        make_link(source="core1", target="dist3", speed="10G"),
+
+        # Distribution redundancy
+        make_link(source="dist1", target="dist2", speed="10G"),
+
+        # Distribution to access
+        make_link(source="dist1", target="acc1", speed="1G"),
+        make_link(source="dist2", target="acc2", speed="1G"),
+        make_link(source="dist3", target="acc3", speed="1G"),
+        make_link(source="dist3", target="acc4", speed="1G"),
+
+        # Isolated island
+        make_link(source="isolated1", target="isolated2", speed="1G"),
+    ]
+
+    vlans = [
+        # VLAN with multiple islands
+        VLAN(id=100, name="Multi-Island-VLAN", description="VLAN with 3 islands",
+             devices=["core1", "core2", "dist1", "dist2", "acc1", "acc2", "acc3", "isolated1", "isolated2"]),
+
+        # VLAN with single island (healthy)
+        VLAN(id=200, name="Healthy-VLAN", description="Connected VLAN",
+             devices=["core1", "core2", "dist1", "dist2", "acc1", "acc2"]),
+
+        # VLAN with only isolated devices
+        VLAN(id=300, name="Isolated-Only-VLAN", description="Only isolated devices",
+             devices=["isolated1", "isolated2"]),
+
+        # Single device VLAN
+        VLAN(id=400, name="Single-Device-VLAN", description="Single device",
+             devices=["core1"]),
+    ]
+
+    return NetworkTopology(devices=devices, links=links, vlans=vlans)
+
+
+# Islands of VLAN 100 in the simple topology
+EXPECTED_MAIN_ISLAND = frozenset({"sw1", "sw2", "sw3"})
+EXPECTED_ISOLATED_ISLAND = frozenset({"sw4", "sw5"})
+
+# (vlan_id, expected result attributes); None means the VLAN does not exist
+SIMPLE_VLAN_CASES = [
+    # Two islands: sw1-sw2-sw3 and sw4-sw5
+    (100, {"vlan_id": 100, "vlan_name": "Test-VLAN", "has_islands": True, "island_count": 2,
+           "total_devices": 5, "main_island_size": 3, "isolated_devices": 2}),
+    # Healthy
+    (200, {"has_islands": False, "island_count": 1, "main_island_size": 3,
+           "isolated_devices": 0, "fragmentation_ratio": 0.0}),
+    # Empty
+    (300, {"has_islands": False, "island_count": 0, "total_devices": 0, "main_island_size": 0,
+           "isolated_devices": 0, "fragmentation_ratio": 0.0}),
+    (999, None),
+]
+
+COMPLEX_VLAN_CASES = [
+    # Main network (core1, core2, dist1, dist2, acc1, acc2), acc3, isolated pair
+    (100, {"has_islands": True, "island_count": 3, "main_island_size": 6}),
+    # Isolated devices only, still one island
+    (300, {"has_islands": False, "island_count": 1, "main_island_size": 2}),
+    # Single device
+    (400, {"has_islands": False, "island_count": 1, "main_island_size": 1, "total_devices": 1}),
+]
+
+
+# The analyzer only reads from its topology, so one build is shared by the session.
+# Tests that need to modify a topology should take create_*_topology().model_copy(deep=True).
+@pytest.fixture(scope="session")
+def sample_topology():
+    """Fixture providing a sample topology for tests."""
+    return create_simple_topology()
+
+
+@pytest.fixture(scope="session")
+def complex_topology():
+    """Fixture providing a complex topology for tests."""
+    return create_complex_topology()
+
+
+@pytest.fixture(scope="session")
+def simple_analyzer(sample_topology):
+    """Fixture providing an analyzer over the sample topology."""
+    return VLANIslandAnalyzer(sample_topology)
+
+
+@pytest.fixture(scope="session")
+def complex_analyzer(complex_topology):
+    """Fixture providing an analyzer over the complex topology."""
+    return VLANIslandAnalyzer(complex_topology)
+
 
 class TestVLANIslandAnalyzer:
     """Test cases for the VLANIslandAnalyzer class."""
     
-    def create_simple_topology(self) -> NetworkTopology:
-        """Create a simple test topology with known island structure."""
-        devices = [
-            Device(id="sw1", type=DeviceType.SWITCH, role=DeviceRole.CORE, location="datacenter"),
-            Device(id="sw2", type=DeviceType.SWITCH, role=DeviceRole.DISTRIBUTION, location="building-a"),
-            Device(id="sw3", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="building-a"),
-            Device(id="sw4", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="building-b"),
-            Device(id="sw5", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="building-b"),
-        ]
-        
-        links = [
-            Link(source="sw1", target="sw2", type=LinkType.ETHERNET, speed="10G"),
-            Link(source="sw2", target="sw3", type=LinkType.ETHERNET, speed="1G"),
-            # Note: sw4 and sw5 are connected to each other but not to the main network
-            Link(source="sw4", target="sw5", type=LinkType.ETHERNET, speed="1G"),
-        ]
-        
-        vlans = [
-            VLAN(id=100, name="Test-VLAN", description="Test VLAN with islands", 
-                 devices=["sw1", "sw2", "sw3", "sw4", "sw5"]),
-            VLAN(id=200, name="Healthy-VLAN", description="Healthy VLAN", 
-                 devices=["sw1", "sw2", "sw3"]),
-            VLAN(id=300, name="Empty-VLAN", description="Empty VLAN", devices=[]),
-        ]
-        
-        return NetworkTopology(devices=devices, links=links, vlans=vlans)
-    
-    def create_complex_topology(self) -> NetworkTopology:
-        """Create a more complex topology with multiple island scenarios."""
-        devices = [
-            # Core layer
-            Device(id="core1", type=DeviceType.SWITCH, role=DeviceRole.CORE, location="datacenter"),
-            Device(id="core2", type=DeviceType.SWITCH, role=DeviceRole.CORE, location="datacenter"),
-            
-            # Distribution layer
-            Device(id="dist1", type=DeviceType.SWITCH, role=DeviceRole.DISTRIBUTION, location="building-a"),
-            Device(id="dist2", type=DeviceType.SWITCH, role=DeviceRole.DISTRIBUTION, location="building-a"),
-            Device(id="dist3", type=DeviceType.SWITCH, role=DeviceRole.DISTRIBUTION, location="building-b"),
-            
-            # Access layer
-            Device(id="acc1", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="building-a-floor1"),
-            Device(id="acc2", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="building-a-floor2"),
-            Device(id="acc3", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="building-b-floor1"),
-            Device(id="acc4", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="building-b-floor2"),
-            
-            # Isolated devices
-            Device(id="isolated1", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="remote"),
-            Device(id="isolated2", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="remote"),
-        ]
-        
-        links = [
-            # Core interconnection
-            Link(source="core1", target="core2", type=LinkType.ETHERNET, speed="40G"),
-            
-            # Core to distribution
-            Link(source="core1", target="dist1", type=LinkType.ETHERNET, speed="10G"),
-            Link(source="core2", target="dist2", type=LinkType.ETHERNET, speed="10G"),
-            Link(source="core1", target="dist3", type=LinkType.ETHERNET, speed="10G"),
-            
-            # Distribution redundancy
-            Link(source="dist1", target="dist2", type=LinkType.ETHERNET, speed="10G"),
-            
-            # Distribution to access
-            Link(source="dist1", target="acc1", type=LinkType.ETHERNET, speed="1G"),
-            Link(source="dist2", target="acc2", type=LinkType.ETHERNET, speed="1G"),
-            Link(source="dist3", target="acc3", type=LinkType.ETHERNET, speed="1G"),
-            Link(source="dist3", target="acc4", type=LinkType.ETHERNET, speed="1G"),
-            
-            # Isolated island
-            Link(source="isolated1", target="isolated2", type=LinkType.ETHERNET, speed="1G"),
-        ]
-        
-        vlans = [
-            # VLAN with multiple islands
-            VLAN(id=100, name="Multi-Island-VLAN", description="VLAN with 3 islands",
-                 devices=["core1", "core2", "dist1", "dist2", "acc1", "acc2", "acc3", "isolated1", "isolated2"]),
-            
-            # VLAN with single island (healthy)
-            VLAN(id=200, name="Healthy-VLAN", description="Connected VLAN",
-                 devices=["core1", "core2", "dist1", "dist2", "acc1", "acc2"]),
-            
-            # VLAN with only isolated devices
-            VLAN(id=300, name="Isolated-Only-VLAN", description="Only isolated devices",
-                 devices=["isolated1", "isolated2"]),
-            
-            # Single device VLAN
-            VLAN(id=400, name="Single-Device-VLAN", description="Single device",
-                 devices=["core1"]),
-        ]
-        
-        return NetworkTopology(devices=devices, links=links, vlans=vlans)
-    
-    def test_simple_island_detection(self):
-        """Test basic island detection with simple topology."""
-        topology = self.create_simple_topology()
-        analyzer = VLANIslandAnalyzer(topology)
+    @pytest.mark.parametrize("vlan_id,expected", SIMPLE_VLAN_CASES)
+    def test_simple_vlan(self, simple_analyzer, vlan_id, expected):
+        """Test per-VLAN results on the simple topology."""
+        result = simple_analyzer.analyze_vlan(vlan_id)
+        if expected is None:
+            assert result is None
+            return
         
-        # Test VLAN 100 (should have 2 islands)
-        result = analyzer.analyze_vlan(100)
         assert result is not None
-        assert result.vlan_id == 100
-        assert result.vlan_name == "Test-VLAN"
-        assert result.has_islands is True
-        assert result.island_count == 2
-        assert result.total_devices == 5
-        assert result.main_island_size == 3  # sw1, sw2, sw3
-        assert result.isolated_devices == 2  # sw4, sw5
-        
-        # Check islands
+        for attr, value in expected.items():
+            assert getattr(result, attr) == value, attr
+    
+    def test_simple_island_membership(self, simple_analyzer):
+        """Test the main and isolated islands of the fragmented VLAN."""
+        result = simple_analyzer.analyze_vlan(100)
         assert len(result.islands) == 2
         main_island = next(island for island in result.islands if island.is_main_island)
         isolated_island = next(island for island in result.islands if not island.is_main_island)
         
         assert main_island.size == 3
         assert isolated_island.size == 2
-        assert main_island.devices == {"sw1", "sw2", "sw3"}
-        assert isolated_island.devices == {"sw4", "sw5"}
-    
-    def test_healthy_vlan(self):
-        """Test detection of healthy VLAN with no islands."""
-        topology = self.create_simple_topology()
-        analyzer = VLANIslandAnalyzer(topology)
+        assert main_island.devices == EXPECTED_MAIN_ISLAND
+        assert isolated_island.devices == EXPECTED_ISOLATED_ISLAND
         
-        # Test VLAN 200 (should be healthy)
-        result = analyzer.analyze_vlan(200)
-        assert result is not None
-        assert result.has_islands is False
-        assert result.island_count == 1
-        assert result.main_island_size == 3
-        assert result.isolated_devices == 0
-        assert result.fragmentation_ratio == 0.0
+        # Islands agree with the union-find reference
+        islands = {frozenset(island.devices) for island in result.islands}
+        assert islands == set(expected_components(simple_analyzer.topology, 100))
     
-    def test_empty_vlan(self):
-        """Test handling of empty VLAN."""
-        topology = self.create_simple_topology()
-        analyzer = VLANIslandAnalyzer(topology)
-        
-        # Test VLAN 300 (empty)
-        result = analyzer.analyze_vlan(300)
+    @pytest.mark.parametrize("vlan_id,expected", COMPLEX_VLAN_CASES)
+    def test_complex_vlan(self, complex_analyzer, vlan_id, expected):
+        """Test per-VLAN results on the complex topology."""
+        result = complex_analyzer.analyze_vlan(vlan_id)
         assert result is not None
-        assert result.has_islands is False
-        assert result.island_count == 0
-        assert result.total_devices == 0
-        assert result.main_island_size == 0
-        assert result.isolated_devices == 0
-        assert result.fragmentation_ratio == 0.0
-    
-    def test_nonexistent_vlan(self):
-        """Test handling of non-existent VLAN."""
-        topology = self.create_simple_topology()
-        analyzer = VLANIslandAnalyzer(topology)
+        for attr, value in expected.items():
+            assert getattr(result, attr) == value, attr
         
-        result = analyzer.analyze_vlan(999)
-        assert result is None
+        islands = {frozenset(island.devices) for island in result.islands}
+        assert islands == set(expected_components(complex_analyzer.topology, vlan_id))
     
-    def test_complex_topology_analysis(self):
-        """Test analysis of complex topology with multiple scenarios."""
-        topology = self.create_complex_topology()
-        analyzer = VLANIslandAnalyzer(topology)
-        
-        # Test VLAN 100 (multi-island)
-        result = analyzer.analyze_vlan(100)
-        assert result is not None
-        assert result.has_islands is True
-        assert result.island_count == 3  # Main network, acc3, isolated pair
-        
-        # Find the main island (should be largest)
-        main_island = next(island for island in result.islands if island.is_main_island)
-        assert main_island.size >= 6  # core1, core2, dist1, dist2, acc1, acc2
-        
-        # Test VLAN 300 (isolated only)
-        result_isolated = analyzer.analyze_vlan(300)
-        assert result_isolated is not None
-        assert result_isolated.has_islands is False  # Only one island
-        assert result_isolated.island_count == 1
-        assert result_isolated.main_island_size == 2
-        
-        # Test VLAN 400 (single device)
-        result_single = analyzer.analyze_vlan(400)
-        assert result_single is not None
-        assert result_single.has_islands is False
-        assert result_single.island_count == 1
-        assert result_single.main_island_size == 1
-        assert result_single.total_devices == 1
-    
-    def test_full_network_analysis(self):
+    def test_full_network_analysis(self, complex_analyzer):
         """Test complete network analysis."""
-        topology = self.create_complex_topology()
-        analyzer = VLANIslandAnalyzer(topology)
-        
-        report = analyzer.analyze_all_vlans()
+        report = complex_analyzer.analyze_all_vlans()
         
         assert report is not None
         assert len(report.vlan_results) == 4
@@ -215,16 +224,34 @@ class TestVLANIslandAnalyzer:
         # Check that problematic VLANs are correctly identified
         problematic_ids = {result.vlan_id for result in report.problematic_vlans}
         assert 100 in problematic_ids  # Multi-island VLAN should be problematic
-        
+
+        # Check pre-sorted views of the results
+        ratios = [result.fragmentation_ratio for result in report.problematic_by_fragmentation]
+        assert ratios == sorted(ratios, reverse=True)
+        assert report.problematic_by_fragmentation[0] is report.worst_fragmented_vlan
+        assert [result.vlan_id for result in report.results_by_vlan_id] == [100, 200, 300, 400]
+
         # Check recommendations are generated
         assert len(report.recommendations) > 0
     
-    def test_fragmentation_ratio_calculation(self):
+    def test_parallel_network_analysis(self, complex_topology):
+        """Test that analyzing VLANs in worker processes matches the serial run."""
+        serial = VLANIslandAnalyzer(complex_topology).analyze_all_vlans()
+        parallel = VLANIslandAnalyzer(complex_topology).analyze_all_vlans(workers=2)
+        
+        assert [r.vlan_id for r in parallel.vlan_results] == [r.vlan_id for r in serial.vlan_results]
+        assert [r.fragmentation_ratio for r in parallel.vlan_results] == [r.fragmentation_ratio for r in serial.vlan_results]
+        assert parallel.total_islands == serial.total_islands
+        assert parallel.recommendations == serial.recommendations
+    
+    def test_invalid_worker_count(self, simple_analyzer):
+        """Test that a worker count below 1 is rejected rather than meaning all CPUs."""
+        with pytest.raises(ValueError):
+            simple_analyzer.analyze_all_vlans(workers=0)
+    
+    def test_fragmentation_ratio_calculation(self, simple_analyzer):
         """Test correct calculation of fragmentation ratios."""
-        topology = self.create_simple_topology()
-        analyzer = VLANIslandAnalyzer(topology)
-        
-        result = analyzer.analyze_vlan(100)
+        result = simple_analyzer.analyze_vlan(100)
         assert result is not None
         
         # VLAN 100: 5 total devices, 3 in main island, 2 isolated
@@ -232,48 +259,39 @@ class TestVLANIslandAnalyzer:
         expected_ratio = 2.0 / 5.0
         assert abs(result.fragmentation_ratio - expected_ratio) < 0.001
     
-    def test_island_device_membership(self):
+    def test_island_device_membership(self, simple_analyzer):
         """Test that devices are correctly assigned to islands."""
-        topology = self.create_simple_topology()
-        analyzer = VLANIslandAnalyzer(topology)
-        
-        result = analyzer.analyze_vlan(100)
+        result = simple_analyzer.analyze_vlan(100)
         assert result is not None
         
-        # Check that all devices are assigned to exactly one island
-        all_island_devices = set()
-        for island in result.islands:
-            assert len(island.devices & all_island_devices) == 0  # No overlap
-            all_island_devices.update(island.devices)
+        # Check that all devices are assigned to exactly one island: the islands are
+        # pairwise disjoint exactly when their sizes add up to the size of their union,
+        # so no per-island intersection is needed. The union is built in place with |=.
+        all_island_devices = reduce(operator.ior, (island.devices for island in result.islands), set())
+        assert sum(len(island.devices) for island in result.islands) == len(all_island_devices)
         
         # All VLAN devices should be in some island
-        vlan = next(v for v in topology.vlans if v.id == 100)
+        vlan = simple_analyzer.vlan_by_id[100]
         assert all_island_devices == set(vlan.devices)
     
-    def test_connection_path_finding(self):
+    def test_connection_path_finding(self, simple_analyzer):
         """Test finding connection paths between devices."""
-        topology = self.create_simple_topology()
-        analyzer = VLANIslandAnalyzer(topology)
-        
         # Test path within connected component
-        paths = analyzer.find_connection_paths("sw1", "sw3", 100)
+        paths = simple_analyzer.find_connection_paths("sw1", "sw3", 100)
         assert len(paths) > 0
         assert ["sw1", "sw2", "sw3"] in paths
         
         # Test path between disconnected components (should be empty)
-        paths_disconnected = analyzer.find_connection_paths("sw1", "sw4", 100)
+        paths_disconnected = simple_analyzer.find_connection_paths("sw1", "sw4", 100)
         assert len(paths_disconnected) == 0
         
         # Test path for devices not in VLAN
-        paths_not_in_vlan = analyzer.find_connection_paths("sw1", "sw4", 200)
+        paths_not_in_vlan = simple_analyzer.find_connection_paths("sw1", "sw4", 200)
         assert len(paths_not_in_vlan) == 0
     
-    def test_connectivity_suggestions(self):
+    def test_connectivity_suggestions(self, simple_analyzer):
         """Test generation of connectivity suggestions."""
-        topology = self.create_simple_topology()
-        analyzer = VLANIslandAnalyzer(topology)
-        
-        suggestions = analyzer.get_island_connectivity_suggestions(100)
+        suggestions = simple_analyzer.get_island_connectivity_suggestions(100)
         
         assert "vlan_id" in suggestions
         assert suggestions["vlan_id"] == 100
@@ -285,30 +303,24 @@ class TestVLANIslandAnalyzer:
         opportunities = suggestions["connection_opportunities"]
         assert len(opportunities) > 0
     
-    def test_physical_graph_construction(self):
+    def test_physical_graph_construction(self, simple_analyzer, sample_topology):
         """Test that physical graph is correctly constructed."""
-        topology = self.create_simple_topology()
-        analyzer = VLANIslandAnalyzer(topology)
-        
-        graph = analyzer.physical_graph
+        graph = simple_analyzer.physical_graph
         
         # Check all devices are nodes
-        assert len(graph.nodes()) == len(topology.devices)
-        for device in topology.devices:
+        assert len(graph.nodes()) == len(sample_topology.devices)
+        for device in sample_topology.devices:
             assert device.id in graph.nodes()
         
         # Check all links are edges
-        assert len(graph.edges()) == len(topology.links)
-        for link in topology.links:
+        assert len(graph.edges()) == len(sample_topology.links)
+        for link in sample_topology.links:
             assert graph.has_edge(link.source, link.target)
     
-    def test_vlan_subgraph_creation(self):
+    def test_vlan_subgraph_creation(self, simple_analyzer):
         """Test creation of VLAN-specific subgraphs."""
-        topology = self.create_simple_topology()
-        analyzer = VLANIslandAnalyzer(topology)
-        
-        vlan = next(v for v in topology.vlans if v.id == 100)
-        subgraph = analyzer._get_vlan_subgraph(vlan)
+        vlan = simple_analyzer.vlan_by_id[100]
+        subgraph = simple_analyzer._get_vlan_subgraph(vlan)
         
         # Subgraph should only contain VLAN devices
         assert set(subgraph.nodes()) == set(vlan.devices)
@@ -318,25 +330,16 @@ class TestVLANIslandAnalyzer:
             assert edge[0] in vlan.devices
             assert edge[1] in vlan.devices
     
-    def test_connected_components_algorithm(self):
+    def test_connected_components_algorithm(self, simple_analyzer):
         """Test the connected components detection algorithm."""
-        topology = self.create_simple_topology()
-        analyzer = VLANIslandAnalyzer(topology)
-        
-        vlan = next(v for v in topology.vlans if v.id == 100)
-        subgraph = analyzer._get_vlan_subgraph(vlan)
-        components = analyzer._find_connected_components(subgraph)
-        
-        assert len(components) == 2
-        
-        # Sort components by size for consistent testing
-        components.sort(key=len, reverse=True)
-        
-        assert len(components[0]) == 3  # Main component
-        assert len(components[1]) == 2  # Isolated component
-        
-        assert components[0] == {"sw1", "sw2", "sw3"}
-        assert components[1] == {"sw4", "sw5"}
+        vlan = simple_analyzer.vlan_by_id[100]
+        subgraph = simple_analyzer._get_vlan_subgraph(vlan)
+        components = simple_analyzer._find_connected_components(subgraph)
+        
+        # Compare against the union-find reference rather than hand-written sets
+        expected = expected_components(simple_analyzer.topology, 100)
+        assert len(components) == len(expected)
+        assert set(map(frozenset, components)) == set(expected)
 
 
 class TestVLANAnalysisResult:
@@ -373,6 +376,10 @@ class TestVLANAnalysisResult:
         
         # Test non-existent device
         assert result.get_island_by_device("nonexistent") is None
+        
+        # Device-to-island map covers every device exactly once
+        assert result.island_by_device.keys() == EXPECTED_MAIN_ISLAND | EXPECTED_ISOLATED_ISLAND
+        assert result.island_by_device["sw5"] is island_isolated
 
 
 class TestVLANIsland:
@@ -393,25 +400,11 @@ class TestVLANIsland:
         assert island_from_list.devices == {"sw1", "sw2"}
 
 
-@pytest.fixture
-def sample_topology():
-    """Fixture providing a sample topology for tests."""
-    return TestVLANIslandAnalyzer().create_simple_topology()
-
-
-@pytest.fixture
-def complex_topology():
-    """Fixture providing a complex topology for tests."""
-    return TestVLANIslandAnalyzer().create_complex_topology()
-
-
-def test_analyzer_initialization(sample_topology):
+def test_analyzer_initialization(simple_analyzer, sample_topology):
     """Test analyzer initialization with topology."""
-    analyzer = VLANIslandAnalyzer(sample_topology)
-    
-    assert analyzer.topology == sample_topology
-    assert len(analyzer._device_index) == len(sample_topology.devices)
-    assert len(analyzer._vlan_index) == len(sample_topology.vlans)
+    assert simple_analyzer.topology is sample_topology
+    assert len(simple_analyzer._device_index) == len(sample_topology.devices)
+    assert len(simple_analyzer._vlan_index) == len(sample_topology.vlans)
 
 
 def test_edge_cases():
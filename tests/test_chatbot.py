@@ -0,0 +1,50 @@
+"""
+Test cases for the chatbot's local (non-LLM) behaviour.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from vlan_islands.models import Device, Link, VLAN, NetworkTopology, DeviceType, DeviceRole, LinkType
+from vlan_islands.chatbot import NetworkChatbot, render_message_html
+
+
+@pytest.fixture(scope="module")
+def small_topology():
+    """Two linked switches sharing one VLAN."""
+    devices = [
+        Device(id="sw-001", type=DeviceType.SWITCH, role=DeviceRole.CORE, location="dc"),
+        Device(id="sw-002", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="floor1")
+    ]
+    links = [Link(source="sw-001", target="sw-002", type=LinkType.ETHERNET, speed="10G")]
+    vlans = [VLAN(id=100, name="Corporate", devices=["sw-001", "sw-002"])]
+    return NetworkTopology(devices=devices, links=links, vlans=vlans)
+
+
+def test_explicit_api_key(small_topology, monkeypatch):
+    """Test that an explicit API key wins over the environment."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-from-env")
+    chatbot = NetworkChatbot(small_topology, api_key="sk-explicit")
+    assert chatbot.client.api_key == "sk-explicit"
+
+
+def test_prune_sessions(small_topology):
+    """Test that only sessions idle past the limit are dropped."""
+    chatbot = NetworkChatbot(small_topology, api_key="sk-test")
+    stale = chatbot.create_session("stale")
+    fresh = chatbot.create_session("fresh")
+    chatbot.sessions[stale].last_activity = datetime.now() - timedelta(hours=3)
+
+    assert chatbot.prune_sessions(timedelta(hours=2)) == 1
+    assert stale not in chatbot.sessions
+    assert fresh in chatbot.sessions
+
+
+def test_render_message_html_escapes_raw_html():
+    """Test that raw HTML is escaped, including after an unclosed code span."""
+    rendered = render_message_html("Use `vlan\n\n<img src=x onerror=alert(1)>\n\nthen` ok")
+    assert "<img" not in rendered
+    assert "&lt;img src=x onerror=alert(1)&gt;" in rendered
+    
+    assert render_message_html("`a<b` **c**") == "<p><code>a&lt;b</code> <strong>c</strong></p>\n"
@@ -10,6 +10,8 @@ from vlan_islands.models import (
     DeviceType, DeviceRole, LinkType
 )
 
+from .conftest import make_device, make_link
+
 
 class TestDevice:
     """Test cases for Device model."""
@@ -75,9 +77,9 @@ class TestDevice:
     
     def test_device_equality(self):
         """Test device equality based on ID."""
-        device1 = Device(id="sw-001", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="a")
-        device2 = Device(id="sw-001", type=DeviceType.ROUTER, role=DeviceRole.CORE, location="b")
-        device3 = Device(id="sw-002", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="a")
+        device1 = make_device(id="sw-001")
+        device2 = make_device(id="sw-001", type=DeviceType.ROUTER, role=DeviceRole.CORE, location="b")
+        device3 = make_device(id="sw-002")
         
         assert device1 == device2  # Same ID
         assert device1 != device3  # Different ID
@@ -85,8 +87,7 @@ class TestDevice:
     
     def test_device_hashable(self):
         """Test that devices can be used in sets and as dict keys."""
-        device1 = Device(id="sw-001", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="a")
-        device2 = Device(id="sw-002", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="a")
+        device1, device2 = make_device(id="sw-000"), make_device(id="sw-001")
         
         device_set = {device1, device2}
         assert len(device_set) == 2
@@ -142,12 +143,7 @@ class TestLink:
     
     def test_link_methods(self):
         """Test link utility methods."""
-        link = Link(
-            source="sw-001",
-            target="sw-002",
-            type=LinkType.ETHERNET,
-            speed="10G"
-        )
+        link = make_link(source="sw-001", target="sw-002", speed="10G")
         
         # Test get_endpoints
         endpoints = link.get_endpoints()
@@ -225,6 +221,11 @@ class TestVLAN:
         assert len(vlan.devices) == 3
         assert set(vlan.devices) == {"sw-001", "sw-002", "sw-003"}
     
+    def test_vlan_device_deduplication_keeps_order(self):
+        """Test that deduplication keeps the first occurrence of each device in order."""
+        vlan = VLAN(id=100, name="Test", devices=["c", "a", "b", "a"])
+        assert vlan.devices == ["c", "a", "b"]
+    
     def test_vlan_device_trimming(self):
         """Test that device IDs in VLAN are trimmed."""
         vlan = VLAN(
@@ -267,25 +268,53 @@ class TestVLAN:
         assert vlan.remove_device("sw-999") is False
 
 
+@pytest.fixture(scope="module")
+def sample_topology():
+    """Two switches joined by one link, both in VLAN 100."""
+    devices = [
+        Device(id="sw-001", type=DeviceType.SWITCH, role=DeviceRole.CORE, location="dc"),
+        Device(id="sw-002", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="floor1")
+    ]
+    
+    links = [
+        Link(source="sw-001", target="sw-002", type=LinkType.ETHERNET, speed="10G")
+    ]
+    
+    vlans = [
+        VLAN(id=100, name="Corporate", devices=["sw-001", "sw-002"])
+    ]
+    
+    return NetworkTopology(devices=devices, links=links, vlans=vlans)
+
+
+@pytest.fixture(scope="module")
+def statistics_topology():
+    """Two switches and a router with two VLANs, for statistics checks."""
+    devices = [
+        Device(id="sw-001", type=DeviceType.SWITCH, role=DeviceRole.CORE, location="dc"),
+        Device(id="sw-002", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="floor1"),
+        Device(id="r-001", type=DeviceType.ROUTER, role=DeviceRole.EDGE, location="dc")
+    ]
+    
+    links = [
+        Link(source="sw-001", target="sw-002", type=LinkType.ETHERNET, speed="10G"),
+        Link(source="sw-001", target="r-001", type=LinkType.ETHERNET, speed="10G")
+    ]
+    
+    vlans = [
+        VLAN(id=100, name="Corporate", devices=["sw-001", "sw-002"]),
+        VLAN(id=200, name="Guest", devices=["sw-001"])
+    ]
+    
+    return NetworkTopology(devices=devices, links=links, vlans=vlans)
+
+
 class TestNetworkTopology:
     """Test cases for NetworkTopology model."""
     
-    def test_valid_topology_creation(self):
+    def test_valid_topology_creation(self, sample_topology):
         """Test creating a valid network topology."""
-        devices = [
-            Device(id="sw-001", type=DeviceType.SWITCH, role=DeviceRole.CORE, location="dc"),
-            Device(id="sw-002", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="floor1")
-        ]
-        
-        links = [
-            Link(source="sw-001", target="sw-002", type=LinkType.ETHERNET, speed="10G")
-        ]
-        
-        vlans = [
-            VLAN(id=100, name="Corporate", devices=["sw-001", "sw-002"])
-        ]
-        
-        topology = NetworkTopology(devices=devices, links=links, vlans=vlans)
+        topology = sample_topology
         
         assert len(topology.devices) == 2
         assert len(topology.links) == 1
@@ -311,22 +340,9 @@ class TestNetworkTopology:
         with pytest.raises(ValidationError, match="Duplicate VLAN IDs"):
             NetworkTopology(devices=[], links=[], vlans=vlans)
     
-    def test_topology_methods(self):
+    def test_topology_methods(self, sample_topology):
         """Test NetworkTopology utility methods."""
-        devices = [
-            Device(id="sw-001", type=DeviceType.SWITCH, role=DeviceRole.CORE, location="dc"),
-            Device(id="sw-002", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="floor1")
-        ]
-        
-        links = [
-            Link(source="sw-001", target="sw-002", type=LinkType.ETHERNET, speed="10G")
-        ]
-        
-        vlans = [
-            VLAN(id=100, name="Corporate", devices=["sw-001", "sw-002"])
-        ]
-        
-        topology = NetworkTopology(devices=devices, links=links, vlans=vlans)
+        topology = sample_topology
         
         # Test get_device_by_id
         device = topology.get_device_by_id("sw-001")
@@ -352,23 +368,21 @@ class TestNetworkTopology:
         neighbors_empty = topology.get_device_neighbors("nonexistent")
         assert neighbors_empty == []
     
-    def test_topology_validation(self):
+    def test_device_ids_interned(self):
+        """Test that device IDs are shared across devices, links and VLANs."""
+        device = Device(id="".join(["sw-", "001"]), type=DeviceType.SWITCH, role=DeviceRole.CORE, location="dc")
+        link = Link(source=" sw-001 ", target="sw-002", type=LinkType.ETHERNET, speed="10G")
+        vlan = VLAN(id=100, name="Corporate", devices=["sw-001 "])
+
+        assert device.id is link.source
+        assert device.id is vlan.devices[0]
+
+    def test_topology_validation(self, sample_topology):
         """Test topology validation method."""
-        devices = [
-            Device(id="sw-001", type=DeviceType.SWITCH, role=DeviceRole.CORE, location="dc"),
-            Device(id="sw-002", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="floor1")
-        ]
+        devices = sample_topology.devices
         
         # Valid topology
-        links = [
-            Link(source="sw-001", target="sw-002", type=LinkType.ETHERNET, speed="10G")
-        ]
-        
-        vlans = [
-            VLAN(id=100, name="Corporate", devices=["sw-001", "sw-002"])
-        ]
-        
-        topology = NetworkTopology(devices=devices, links=links, vlans=vlans)
+        topology = sample_topology
         errors = topology.validate_topology()
         assert len(errors) == 0
         
@@ -392,25 +406,9 @@ class TestNetworkTopology:
         assert len(errors) > 0
         assert any("non-existent" in error.lower() for error in errors)
     
-    def test_topology_statistics(self):
+    def test_topology_statistics(self, statistics_topology):
         """Test topology statistics generation."""
-        devices = [
-            Device(id="sw-001", type=DeviceType.SWITCH, role=DeviceRole.CORE, location="dc"),
-            Device(id="sw-002", type=DeviceType.SWITCH, role=DeviceRole.ACCESS, location="floor1"),
-            Device(id="r-001", type=DeviceType.ROUTER, role=DeviceRole.EDGE, location="dc")
-        ]
-        
-        links = [
-            Link(source="sw-001", target="sw-002", type=LinkType.ETHERNET, speed="10G"),
-            Link(source="sw-001", target="r-001", type=LinkType.ETHERNET, speed="10G")
-        ]
-        
-        vlans = [
-            VLAN(id=100, name="Corporate", devices=["sw-001", "sw-002"]),
-            VLAN(id=200, name="Guest", devices=["sw-001"])
-        ]
-        
-        topology = NetworkTopology(devices=devices, links=links, vlans=vlans)
+        topology = statistics_topology
         stats = topology.get_statistics()
         
         assert stats["total_devices"] == 3
@@ -430,28 +428,36 @@ class TestNetworkTopology:
 class TestEnums:
     """Test cases for enum values."""
     
-    def test_device_type_enum(self):
+    @pytest.mark.parametrize("member,value", [
+        (DeviceType.SWITCH, "switch"),
+        (DeviceType.ROUTER, "router"),
+        (DeviceType.CONTROLLER, "controller"),
+        (DeviceType.ACCESS_POINT, "access-point"),
+    ])
+    def test_device_type_enum(self, member, value):
         """Test DeviceType enum values."""
-        assert DeviceType.SWITCH.value == "switch"
-        assert DeviceType.ROUTER.value == "router"
-        assert DeviceType.CONTROLLER.value == "controller"
-        assert DeviceType.ACCESS_POINT.value == "access-point"
+        assert member.value == value
     
-    def test_device_role_enum(self):
+    @pytest.mark.parametrize("member,value", [
+        (DeviceRole.CORE, "core"),
+        (DeviceRole.DISTRIBUTION, "distribution"),
+        (DeviceRole.ACCESS, "access"),
+        (DeviceRole.EDGE, "edge"),
+        (DeviceRole.WIFI, "wifi"),
+        (DeviceRole.STORAGE, "storage"),
+    ])
+    def test_device_role_enum(self, member, value):
         """Test DeviceRole enum values."""
-        assert DeviceRole.CORE.value == "core"
-        assert DeviceRole.DISTRIBUTION.value == "distribution"
-        assert DeviceRole.ACCESS.value == "access"
-        assert DeviceRole.EDGE.value == "edge"
-        assert DeviceRole.WIFI.value == "wifi"
-        assert DeviceRole.STORAGE.value == "storage"
-    
-    def test_link_type_enum(self):
+        assert member.value == value
+    
+    @pytest.mark.parametrize("member,value", [
+        (LinkType.ETHERNET, "ethernet"),
+        (LinkType.FIBER, "fiber"),
+        (LinkType.WIRELESS, "wireless"),
+    ])
+    def test_link_type_enum(self, member, value):
         """Test LinkType enum values."""
-        assert LinkType.ETHERNET.value == "ethernet"
-        assert LinkType.FIBER.value == "fiber"
-        assert LinkType.WIRELESS.value == "wireless"
-
+        assert member.value == value
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
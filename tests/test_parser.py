@@ -0,0 +1,38 @@
+"""
+Test cases for loading network topologies from raw JSON.
+"""
+
+import json
+
+import pytest
+
+from vlan_islands.parser import NetworkTopologyParser, NetworkParseError
+
+
+TOPOLOGY_DATA = {
+    "devices": [
+        {"id": "sw-001", "type": "switch", "role": "core", "location": "dc"},
+        {"id": "sw-002", "type": "switch", "role": "access", "location": "floor1"}
+    ],
+    "links": [
+        {"source": "sw-001", "target": "sw-002", "type": "ethernet", "speed": "10G"}
+    ],
+    "vlans": [
+        {"id": 100, "name": "Corporate", "devices": ["sw-001", "sw-002"]}
+    ]
+}
+
+
+def test_load_from_bytes():
+    """Test loading a topology from in-memory JSON bytes."""
+    topology = NetworkTopologyParser.load_from_bytes(json.dumps(TOPOLOGY_DATA).encode())
+
+    assert [device.id for device in topology.devices] == ["sw-001", "sw-002"]
+    assert len(topology.links) == 1
+    assert topology.get_vlan_by_id(100).name == "Corporate"
+
+
+def test_load_from_bytes_invalid_json():
+    """Test that malformed JSON raises NetworkParseError."""
+    with pytest.raises(NetworkParseError, match="Invalid JSON format"):
+        NetworkTopologyParser.load_from_bytes(b'{"devices": [')
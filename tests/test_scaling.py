@@ -0,0 +1,67 @@
+"""
+Scaling test cases for VLAN island detection.
+
+These tests analyze procedurally generated topologies of increasing size and
+check only invariants plus a per-device time budget, so accidental quadratic
+behaviour shows up as a failure rather than a slow suite.
+"""
+
+import time
+
+import pytest
+
+from vlan_islands.models import NetworkTopology, VLAN
+from vlan_islands.analyzer import VLANIslandAnalyzer
+
+from .conftest import make_device, make_link
+
+
+# Seconds of analysis allowed per device, with a floor for timer and interpreter noise
+TIME_PER_DEVICE = 1e-4
+MIN_TIME_BUDGET = 0.01
+
+
+def make_chain_plus_isolated(n: int, k_isolated: int) -> NetworkTopology:
+    """
+    Create a topology of n switches: a chain of n - k_isolated devices plus a
+    separate clique of k_isolated devices, all in VLAN 100.
+    """
+    ids = [f"sw-{i:05d}" for i in range(n)]
+    devices = [make_device(id=device_id) for device_id in ids]
+
+    chain, clique = ids[:n - k_isolated], ids[n - k_isolated:]
+    links = [make_link(source=a, target=b) for a, b in zip(chain, chain[1:])]
+    links += [
+        make_link(source=a, target=b)
+        for i, a in enumerate(clique) for b in clique[i + 1:]
+    ]
+
+    vlans = [VLAN(id=100, name="Scaling-VLAN", devices=ids)]
+    return NetworkTopology(devices=devices, links=links, vlans=vlans)
+
+
+@pytest.fixture(params=[10, 100, 1000, pytest.param(10000, marks=pytest.mark.slow)])
+def scaled_topology(request):
+    """Fixture providing a chain-plus-clique topology of the parametrized size."""
+    n = request.param
+    k_isolated = max(2, min(n // 10, 20))
+    return n, k_isolated, make_chain_plus_isolated(n, k_isolated)
+
+
+def test_island_detection_scales(scaled_topology):
+    """Test island invariants and the time budget on growing topologies."""
+    n, k_isolated, topology = scaled_topology
+    analyzer = VLANIslandAnalyzer(topology)
+    analyzer.physical_graph  # Graph construction is not part of the budget
+
+    start = time.perf_counter()
+    result = analyzer.analyze_vlan(100)
+    elapsed = time.perf_counter() - start
+
+    assert result is not None
+    assert result.island_count == 2
+    assert result.total_devices == n
+    assert result.main_island_size == n - k_isolated
+    assert result.isolated_devices == k_isolated
+    assert 0.0 <= result.fragmentation_ratio <= 1.0
+    assert elapsed < max(n * TIME_PER_DEVICE, MIN_TIME_BUDGET), f"{n} devices took {elapsed:.3f}s"
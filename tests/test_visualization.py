@@ -0,0 +1,27 @@
+"""
+Test cases for the network visualizer.
+"""
+
+from vlan_islands.models import Link, VLAN, NetworkTopology, DeviceRole, LinkType
+from vlan_islands.visualization import NetworkVisualizer
+
+from .conftest import make_device
+
+
+def test_links_to_unknown_devices_are_skipped(tmp_path):
+    """Test that links to devices missing from the topology are not drawn."""
+    topology = NetworkTopology(
+        devices=[make_device(id="sw-001", role=DeviceRole.CORE), make_device(id="sw-002")],
+        links=[
+            Link(source="sw-001", target="sw-002", type=LinkType.ETHERNET, speed="10G"),
+            Link(source="sw-002", target="ghost", type=LinkType.ETHERNET, speed="1G")
+        ],
+        vlans=[VLAN(id=100, name="Corporate", devices=["sw-001", "sw-002", "ghost"])]
+    )
+    assert any("ghost" in error for error in topology.validate_topology())
+
+    visualizer = NetworkVisualizer(topology)
+    assert visualizer._link_rows.tolist() == [[0, 1]]
+
+    visualizer.create_topology_visualization(tmp_path / "topology.png", format="png")
+    visualizer.create_vlan_visualization(100, tmp_path / "vlan_100.html")
@@ -6,11 +6,22 @@ This script tests multiple algorithms and approaches to ensure the correctness
 of the 63 islands detection result.
 """
 
+import heapq
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from collections import defaultdict
 import networkx as nx
-from typing import Set, List, Dict, Tuple
+import numpy as np
+from typing import Set, List, Dict, Tuple, Iterable, Optional, Union
+
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components as csgraph_components
+    _HAS_SCIPY = True
+except ImportError:
+    _HAS_SCIPY = False
 
 # Add src to path
 sys.path.insert(0, str(Path("src").absolute()))
@@ -18,12 +29,20 @@ sys.path.insert(0, str(Path("src").absolute()))
 from vlan_islands.parser import load_network_topology
 from vlan_islands.analyzer import VLANIslandAnalyzer
 
+# Below this many devices across all requested VLANs, worker start-up costs more than it saves
+_PARALLEL_MIN_DEVICES = 100
+
 class AlgorithmVerification:
     """Verification class to test multiple island detection algorithms."""
     
     def __init__(self, topology):
         self.topology = topology
         self.device_links = self._build_device_links_map()
+        self._build_csr()
+        
+        # VLAN lookup and member sets, reused by every verification call
+        self._vlan_by_id = {vlan.id: vlan for vlan in topology.vlans}
+        self._vlan_device_sets = {vlan.id: frozenset(vlan.devices) for vlan in topology.vlans}
         
     def _build_device_links_map(self) -> Dict[str, Set[str]]:
         """Build adjacency map for devices."""
@@ -33,27 +52,60 @@ class AlgorithmVerification:
             device_links[link.target].add(link.source)
         return dict(device_links)
     
+    def _build_csr(self) -> None:
+        """Index devices with contiguous ints and flatten the adjacency map into CSR arrays."""
+        device_ids = sorted({device.id for device in self.topology.devices} | self.device_links.keys())
+        self._device_ids = device_ids
+        self._idx = {device: i for i, device in enumerate(device_ids)}
+        
+        degrees = np.fromiter(
+            (len(self.device_links.get(device, ())) for device in device_ids),
+            dtype=np.int32, count=len(device_ids)
+        )
+        self._indptr = np.zeros(len(device_ids) + 1, dtype=np.int32)
+        np.cumsum(degrees, out=self._indptr[1:])
+        self._indices = np.fromiter(
+            (self._idx[neighbor] for device in device_ids for neighbor in self.device_links.get(device, ())),
+            dtype=np.int32, count=int(self._indptr[-1])
+        )
+        # Row of every CSR entry, so edge lists can be filtered with array masks
+        self._rows = np.repeat(np.arange(len(device_ids), dtype=np.int32), degrees)
+        # Per-device int neighbor lists for the Python traversals: list indexing, no string hashing
+        indptr = self._indptr.tolist()
+        indices = self._indices.tolist()
+        self._adj: List[List[int]] = [indices[indptr[i]:indptr[i + 1]] for i in range(len(device_ids))]
+        if _HAS_SCIPY:
+            n = len(device_ids)
+            self._adjacency = csr_matrix(
+                (np.ones(len(self._indices), dtype=np.int8), self._indices, self._indptr), shape=(n, n)
+            )
+    
     def dfs_connected_components(self, devices: Set[str]) -> List[Set[str]]:
         """
         Algorithm 1: Depth-First Search (DFS) - Our current implementation
         Time: O(V + E), Space: O(V)
         """
-        visited = set()
+        idx, adj, device_ids = self._idx, self._adj, self._device_ids
+        members = [idx[device] for device in devices]
+        # Doubles as the visited set: a device is cleared once it has been reached
+        pending = bytearray(len(device_ids))
+        for i in members:
+            pending[i] = 1
         components = []
         
-        def dfs(node: str, component: Set[str]):
-            visited.add(node)
-            component.add(node)
-            
-            for neighbor in self.device_links.get(node, set()):
-                if neighbor in devices and neighbor not in visited:
-                    dfs(neighbor, component)
-        
-        for device in devices:
-            if device not in visited:
-                component = set()
-                dfs(device, component)
-                components.append(component)
+        for start in members:
+            if pending[start]:
+                pending[start] = 0
+                component = [start]
+                # Explicit stack: no frame per node and no recursion-depth ceiling
+                stack = [start]
+                while stack:
+                    for neighbor in adj[stack.pop()]:
+                        if pending[neighbor]:
+                            pending[neighbor] = 0
+                            component.append(neighbor)
+                            stack.append(neighbor)
+                components.append({device_ids[i] for i in component})
                 
         return components
     
@@ -64,70 +116,69 @@ class AlgorithmVerification:
         """
         from collections import deque
         
-        visited = set()
+        idx, adj, device_ids = self._idx, self._adj, self._device_ids
+        members = [idx[device] for device in devices]
+        pending = bytearray(len(device_ids))
+        for i in members:
+            pending[i] = 1
         components = []
         
-        for start_device in devices:
-            if start_device not in visited:
-                component = set()
-                queue = deque([start_device])
-                visited.add(start_device)
-                component.add(start_device)
+        for start in members:
+            if pending[start]:
+                pending[start] = 0
+                component = [start]
+                queue = deque([start])
                 
                 while queue:
-                    current = queue.popleft()
-                    for neighbor in self.device_links.get(current, set()):
-                        if neighbor in devices and neighbor not in visited:
-                            visited.add(neighbor)
-                            component.add(neighbor)
+                    for neighbor in adj[queue.popleft()]:
+                        if pending[neighbor]:
+                            pending[neighbor] = 0
+                            component.append(neighbor)
                             queue.append(neighbor)
                 
-                components.append(component)
+                components.append({device_ids[i] for i in component})
         
         return components
     
     def union_find_components(self, devices: Set[str]) -> List[Set[str]]:
         """
         Algorithm 3: Union-Find (Disjoint Set Union)
-        Time: O(V * α(V) + E), Space: O(V) where α is inverse Ackermann
+        Vectorized: roots hook onto the smaller root across every edge at once, then
+        pointer jumping flattens the trees; repeats until no edge spans two trees.
+        Time: O(V + E) array work per round, Space: O(V + E)
         """
         device_list = list(devices)
-        device_to_idx = {device: i for i, device in enumerate(device_list)}
-        
-        parent = list(range(len(device_list)))
-        rank = [0] * len(device_list)
         
-        def find(x):
-            if parent[x] != x:
-                parent[x] = find(parent[x])  # Path compression
-            return parent[x]
+        # Map the global device indices to positions in device_list with arrays,
+        # then keep each in-VLAN edge once (row < column)
+        n_total = len(self._device_ids)
+        members = np.fromiter((self._idx[device] for device in device_list), dtype=np.int32, count=len(device_list))
+        in_vlan = np.zeros(n_total, dtype=bool)
+        in_vlan[members] = True
+        local = np.empty(n_total, dtype=np.int32)
+        local[members] = np.arange(len(device_list), dtype=np.int32)
+        rows, cols = self._rows, self._indices
+        keep = in_vlan[rows] & in_vlan[cols] & (rows < cols)
+        u, v = local[rows[keep]], local[cols[keep]]
         
-        def union(x, y):
-            px, py = find(x), find(y)
-            if px == py:
-                return
-            # Union by rank
-            if rank[px] < rank[py]:
-                parent[px] = py
-            elif rank[px] > rank[py]:
-                parent[py] = px
-            else:
-                parent[py] = px
-                rank[px] += 1
-        
-        # Union connected devices
-        for device in devices:
-            if device in self.device_links:
-                device_idx = device_to_idx[device]
-                for neighbor in self.device_links[device]:
-                    if neighbor in devices:
-                        neighbor_idx = device_to_idx[neighbor]
-                        union(device_idx, neighbor_idx)
+        # parent[x] <= x throughout, so hooking can never form a cycle
+        parent = np.arange(len(device_list), dtype=np.int32)
+        while len(u):
+            pu, pv = parent[u], parent[v]
+            if np.array_equal(pu, pv):
+                break
+            # Union: hook the larger root under the smaller one
+            np.minimum.at(parent, np.maximum(pu, pv), np.minimum(pu, pv))
+            # Find: full path compression by pointer jumping
+            while True:
+                grandparent = parent[parent]
+                if np.array_equal(grandparent, parent):
+                    break
+                parent = grandparent
         
         # Group devices by root parent
         components_dict = defaultdict(set)
-        for i, device in enumerate(device_list):
-            root = find(i)
+        for device, root in zip(device_list, parent.tolist()):
             components_dict[root].add(device)
         
         return list(components_dict.values())
@@ -137,70 +188,170 @@ class AlgorithmVerification:
         Algorithm 4: NetworkX built-in connected components
         Uses optimized C implementations under the hood
         """
-        # Create subgraph with only VLAN devices
+        # Create subgraph with only VLAN devices. A node-filtered view of one shared
+        # graph was measured slower: every adjacency access goes through the filter.
         G = nx.Graph()
         G.add_nodes_from(devices)
-        
-        for device in devices:
-            if device in self.device_links:
-                for neighbor in self.device_links[device]:
-                    if neighbor in devices:
-                        G.add_edge(device, neighbor)
+        get = self.device_links.get
+        G.add_edges_from(
+            (device, neighbor)
+            for device in devices
+            for neighbor in get(device, ())
+            if neighbor in devices
+        )
         
         return [set(component) for component in nx.connected_components(G)]
     
-    def verify_vlan_islands(self, vlan_id: int) -> Dict[str, any]:
-        """Verify island detection for a specific VLAN using all algorithms."""
-        vlan = next((v for v in self.topology.vlans if v.id == vlan_id), None)
-        if not vlan:
-            return {"error": f"VLAN {vlan_id} not found"}
-        
-        devices = set(vlan.devices)
-        if not devices:
-            return {"vlan_id": vlan_id, "devices": 0, "islands": 0, "consistent": True}
-        
-        print(f"\n[*] Verifying VLAN {vlan_id} ({vlan.name})")
-        print(f"   Devices: {len(devices)}")
+    def scipy_components(self, devices: Set[str]) -> List[Set[str]]:
+        """
+        Algorithm 5: SciPy csgraph connected components (optional)
+        Compiled O(V + E) labelling on the induced CSR submatrix
+        """
+        device_list = list(devices)
+        idx = np.fromiter((self._idx[device] for device in device_list), dtype=np.int32, count=len(device_list))
+        _, labels = csgraph_components(self._adjacency[idx][:, idx], directed=False)
         
-        # Test all algorithms
+        components_dict = defaultdict(set)
+        for device, label in zip(device_list, labels.tolist()):
+            components_dict[label].add(device)
+        return list(components_dict.values())
+    
+    def algorithms(self) -> Dict[str, callable]:
+        """Connected-components algorithms to cross-check, by display name."""
         algorithms = {
             "DFS": self.dfs_connected_components,
             "BFS": self.bfs_connected_components, 
             "Union-Find": self.union_find_components,
             "NetworkX": self.networkx_components
         }
+        if _HAS_SCIPY:
+            algorithms["SciPy"] = self.scipy_components
+        return algorithms
+    
+    def run_algorithm(self, name: str, vlan_id: int) -> Union[List[Set[str]], Exception]:
+        """Run one algorithm on one VLAN; failures are returned rather than raised."""
+        try:
+            return self.algorithms()[name](self._vlan_device_sets[vlan_id])
+        except Exception as e:
+            return e
+    
+    def run_algorithms(self, vlan_ids: Iterable[int], workers: Optional[int] = 1) -> Dict[int, Dict[str, Union[List[Set[str]], Exception]]]:
+        """
+        Run every algorithm on every VLAN, one task per (algorithm, VLAN) pair.
+        
+        Args:
+            vlan_ids: VLANs to verify
+            workers: Worker processes to use; None means one per CPU. Small
+                workloads always run in this process.
+            
+        Returns:
+            Components (or the raised exception) by VLAN ID and algorithm name
+        """
+        tasks = [
+            (name, vlan_id)
+            for vlan_id in vlan_ids if self._vlan_device_sets.get(vlan_id)
+            for name in self.algorithms()
+        ]
+        
+        workers = workers or os.cpu_count() or 1
+        total_devices = sum(len(self._vlan_device_sets[vlan_id]) for vlan_id in {v for _, v in tasks})
+        if workers == 1 or total_devices < _PARALLEL_MIN_DEVICES:
+            outputs = [self.run_algorithm(name, vlan_id) for name, vlan_id in tasks]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_verifier_worker,
+                initargs=(self.topology,)
+            ) as executor:
+                chunksize = max(1, len(tasks) // (4 * workers))
+                outputs = list(executor.map(_run_verification_task, tasks, chunksize=chunksize))
+        
+        # Regroup by VLAN, keeping the algorithm order
+        results: Dict[int, Dict[str, Union[List[Set[str]], Exception]]] = defaultdict(dict)
+        for (name, vlan_id), output in zip(tasks, outputs):
+            results[vlan_id][name] = output
+        return dict(results)
+    
+    def verify_vlan_islands(self, vlan_id: int, precomputed: Optional[Dict[str, Union[List[Set[str]], Exception]]] = None,
+                            top_k: Optional[int] = None, modes: Optional[Iterable[str]] = None) -> Dict[str, any]:
+        """
+        Verify island detection for a specific VLAN using all algorithms.
+        
+        Args:
+            vlan_id: VLAN to verify
+            precomputed: Per-algorithm output from run_algorithms; computed here if omitted
+            top_k: Keep only the k largest components instead of sorting them all
+            modes: Algorithm names to check, in order; all of them if omitted
+        
+        Returns:
+            Verification result; its "log" entry holds the report lines for the
+            caller to print, so nothing is written while verifying
+            
+        Raises:
+            ValueError: If modes is empty or names an unknown algorithm
+        """
+        algorithms = self.algorithms()
+        names = list(modes) if modes is not None else list(algorithms)
+        unknown = [name for name in names if name not in algorithms]
+        if unknown or not names:
+            raise ValueError(f"modes must name algorithms from {list(algorithms)}, got {names}")
+        
+        vlan = self._vlan_by_id.get(vlan_id)
+        if not vlan:
+            return {"error": f"VLAN {vlan_id} not found"}
+        
+        devices = self._vlan_device_sets[vlan_id]
+        if not devices:
+            return {"vlan_id": vlan_id, "devices": 0, "islands": 0, "consistent": True}
+        
+        log: List[str] = [f"\n[*] Verifying VLAN {vlan_id} ({vlan.name})", f"   Devices: {len(devices)}"]
+        
+        # Test the selected algorithms
+        if precomputed is None:
+            precomputed = {name: self.run_algorithm(name, vlan_id) for name in names}
+        else:
+            precomputed = {name: precomputed[name] for name in names if name in precomputed}
         
         results = {}
         island_counts = []
         
-        for name, algorithm in algorithms.items():
+        for name, components in precomputed.items():
             try:
-                components = algorithm(devices)
+                if isinstance(components, Exception):
+                    raise components
                 island_count = len(components)
                 island_counts.append(island_count)
                 
-                # Sort components by size for consistent comparison
-                components.sort(key=len, reverse=True)
+                # Largest components first, for consistent comparison and display
+                if top_k is None:
+                    components.sort(key=len, reverse=True)
+                else:
+                    components = heapq.nlargest(top_k, components, key=len)
                 
                 results[name] = {
                     "islands": island_count,
                     "components": components,
+                    "component_sizes": sorted(map(len, precomputed[name]), reverse=True),
                     "largest_island": len(components[0]) if components else 0
                 }
                 
-                print(f"   {name:<12}: {island_count} islands")
+                log.append(f"   {name:<12}: {island_count} islands")
                 
             except Exception as e:
-                print(f"   {name:<12}: ERROR - {e}")
+                log.append(f"   {name:<12}: ERROR - {e}")
                 results[name] = {"error": str(e)}
         
-        # Check consistency
-        consistent = len(set(island_counts)) <= 1
+        # Check consistency; a VLAN no algorithm could analyze is not verified
+        consistent = len(set(island_counts)) == 1
         
-        if not consistent:
-            print(f"   [!] INCONSISTENT RESULTS: {island_counts}")
+        if not island_counts:
+            log.append("   [X] No algorithm produced a result")
+        elif not consistent:
+            log.append(f"   [!] INCONSISTENT RESULTS: {island_counts}")
+        elif len(island_counts) == 1:
+            log.append(f"   [+] 1 algorithm run: {island_counts[0]} islands")
         else:
-            print(f"   [+] All algorithms agree: {island_counts[0]} islands")
+            log.append(f"   [+] All algorithms agree: {island_counts[0]} islands")
         
         return {
             "vlan_id": vlan_id,
@@ -208,10 +359,17 @@ class AlgorithmVerification:
             "total_devices": len(devices),
             "results": results,
             "consistent": consistent,
-            "island_count": island_counts[0] if consistent else "INCONSISTENT"
+            "island_count": island_counts[0] if consistent else ("INCONSISTENT" if island_counts else "ERROR"),
+            "log": log
         }
 
 
+def _print_log(verification: Dict[str, any]) -> None:
+    """Write the report lines collected by verify_vlan_islands in one go."""
+    if verification.get("log"):
+        sys.stdout.write("\n".join(verification["log"]) + "\n")
+
+
 def main():
     print("[*] VLAN Islands Algorithm Verification")
     print("=" * 60)
@@ -241,8 +399,12 @@ def main():
     total_verified_islands = 0
     all_consistent = True
     
+    # All (algorithm, VLAN) pairs are independent, so they are spread over worker processes
+    components = verifier.run_algorithms((r.vlan_id for r in report.problematic_vlans), workers=None)
+    
     for vlan_result in report.problematic_vlans:
-        verification = verifier.verify_vlan_islands(vlan_result.vlan_id)
+        verification = verifier.verify_vlan_islands(vlan_result.vlan_id, components.get(vlan_result.vlan_id))
+        _print_log(verification)
         
         if verification.get("consistent"):
             total_verified_islands += verification["island_count"]
@@ -254,17 +416,16 @@ def main():
     print(f"\n[*] Verifying Healthy VLANs (should have 1 island each):")
     print("-" * 60)
     
-    for vlan_result in report.healthy_vlans[:5]:  # Test first 5
-        verification = verifier.verify_vlan_islands(vlan_result.vlan_id)
-        if verification.get("island_count") != 1:
-            print(f"[X] VLAN {vlan_result.vlan_id} should have 1 island but has {verification.get('island_count')}")
+    # A single BFS per VLAN is enough to confirm a known-good VLAN, so every healthy
+    # VLAN is checked instead of sampling a few and assuming the rest
+    for vlan_result in report.healthy_vlans:
+        island_count = len(verifier.bfs_connected_components(verifier._vlan_device_sets[vlan_result.vlan_id]))
+        if island_count > 1 or island_count != vlan_result.island_count:
+            print(f"[X] VLAN {vlan_result.vlan_id} should have 1 island but has {island_count}")
             all_consistent = False
         else:
-            total_verified_islands += 1
-    
-    # Add remaining healthy VLANs (assuming they're correct)
-    remaining_healthy = len(report.healthy_vlans) - 5
-    total_verified_islands += remaining_healthy
+            total_verified_islands += island_count
+    print(f"   BFS checked {len(report.healthy_vlans)} healthy VLANs")
     
     print(f"\n[#] Final Verification Results:")
     print("-" * 40)
@@ -283,7 +444,9 @@ def main():
     
     if report.worst_fragmented_vlan:
         worst_vlan = report.worst_fragmented_vlan
-        verification = verifier.verify_vlan_islands(worst_vlan.vlan_id)
+        # Its algorithms were already cross-checked above; only the detail is needed here
+        verification = verifier.verify_vlan_islands(worst_vlan.vlan_id, top_k=5, modes=("NetworkX",))
+        _print_log(verification)
         
         print(f"VLAN {worst_vlan.vlan_id} ({worst_vlan.vlan_name}):")
         print(f"   Devices: {worst_vlan.total_devices}")
@@ -296,27 +459,46 @@ def main():
             nx_result = verification["results"].get("NetworkX", {})
             if "components" in nx_result:
                 components = nx_result["components"]
-                print(f"   Component sizes: {[len(c) for c in components]}")
+                print(f"   Component sizes: {nx_result['component_sizes']}")
                 
                 # Show actual devices in each component
-                for i, component in enumerate(components[:5], 1):
+                for i, component in enumerate(components, 1):
                     devices_list = sorted(list(component))
                     if len(devices_list) <= 3:
                         print(f"   Island {i}: {', '.join(devices_list)}")
                     else:
                         print(f"   Island {i}: {', '.join(devices_list[:3])} ... (+{len(devices_list)-3} more)")
         else:
-            print(f"   [X] Inconsistent results across algorithms")
+            print(f"   [X] Could not verify: {verification.get('island_count', verification.get('error'))}")
     
     # Algorithm performance comparison
     print(f"\n[*] Algorithm Performance Characteristics:")
     print("-" * 40)
     print("DFS (Current):     O(V + E) time, O(V) space - Good for sparse graphs")
     print("BFS:               O(V + E) time, O(V) space - Better cache locality")
-    print("Union-Find:        O(V·a(V) + E) time - Best for dynamic connectivity")
+    print("Union-Find:        O(V + E) array work per round - Vectorized hooking and pointer jumping")
     print("NetworkX:          O(V + E) time - Optimized C implementation")
+    if _HAS_SCIPY:
+        print("SciPy:             O(V + E) time - Compiled csgraph labelling")
     print("\nAll algorithms are theoretically equivalent for this problem.")
     print("DFS is optimal choice for static graph analysis.")
 
+
+# Per-process verifier for run_algorithms(workers > 1), built once by the pool initializer
+_worker_verifier: Optional[AlgorithmVerification] = None
+
+
+def _init_verifier_worker(topology) -> None:
+    """Build the worker process's verifier once from the pickled topology."""
+    global _worker_verifier
+    _worker_verifier = AlgorithmVerification(topology)
+
+
+def _run_verification_task(task: Tuple[str, int]) -> Union[List[Set[str]], Exception]:
+    """Run one (algorithm name, VLAN ID) task in a worker process."""
+    name, vlan_id = task
+    return _worker_verifier.run_algorithm(name, vlan_id)
+
+
 if __name__ == "__main__":
     main()